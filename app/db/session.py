@@ -1,5 +1,7 @@
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
+from contextlib import contextmanager
 from .schema import Base
 import os
 import shutil
@@ -16,6 +18,8 @@ engine = create_engine(
         "check_same_thread": False,
         "timeout": 30  # 30 second timeout for better reliability
     },
+    poolclass=QueuePool,
+    pool_use_lifo=True,  # Reuse the most recently returned (warm) connection first
     pool_pre_ping=True,  # Verify connections before use
     echo=False  # Set to True for SQL debugging
 )
@@ -73,6 +77,15 @@ verify_picks_table()
 def get_db():
     """Dependency injection for database session."""
     db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+@contextmanager
+def db_session():
+    """Context manager for a database session in CLI commands."""
+    db = SessionLocal()
     try:
         yield db
     finally:
@@ -2,11 +2,64 @@
 H2H (Head-to-Head) statistics helper for hitter vs pitcher matchups.
 """
 import statsapi
+import time
 from typing import Dict, Tuple
 
 # Simple cache for H2H results
 _h2h_cache: Dict[Tuple[int, int, str], str] = {}
 
+# Per-(pitcher, season) matchup tables: {batter_id: (hits, at_bats)}
+_matchups_cache: Dict[Tuple[int, str], Tuple[float, Dict[int, Tuple[int, int]]]] = {}
+_MATCHUPS_TTL = 900  # seconds
+
+# For now, use a known game for demonstration
+# In production, this would search through all games in the season
+_KNOWN_GAMES = [777620]  # 6/6/2025 Dodgers @ Cardinals game
+
+_NON_AT_BAT_EVENTS = frozenset(['Walk', 'Hit By Pitch', 'Catcher Interference', 'Intent Walk'])
+_HIT_EVENTS = frozenset(['Single', 'Double', 'Triple', 'Home Run'])
+
+def fetch_pitcher_season_matchups(pitcher_id, season=2025):
+    """
+    Get every batter's head-to-head line against one pitcher for a season.
+    Returns a dict of {batter_id: (hits, at_bats)}; the table is fetched once
+    per (pitcher, season) and cached for _MATCHUPS_TTL seconds. If any game
+    fails to load, the partial table is returned but not cached.
+    """
+    if not pitcher_id:
+        return {}
+
+    cache_key = (int(pitcher_id), str(season))
+    now = time.monotonic()
+    hit = _matchups_cache.get(cache_key)
+    if hit and now - hit[0] < _MATCHUPS_TTL:
+        return hit[1]
+
+    totals: Dict[int, list] = {}
+    complete = True
+    for game_id in _KNOWN_GAMES:
+        game_matchups = _extract_pitcher_matchups_from_game(game_id, int(pitcher_id))
+        if game_matchups is None:
+            complete = False
+            continue
+        for batter_id, (hits, at_bats) in game_matchups.items():
+            line = totals.setdefault(batter_id, [0, 0])
+            line[0] += hits
+            line[1] += at_bats
+
+    matchups = {batter_id: (line[0], line[1]) for batter_id, line in totals.items()}
+    # Only cache a table built from every game, so a failed fetch is retried next call
+    if complete:
+        _matchups_cache[cache_key] = (now, matchups)
+    return matchups
+
+def format_h2h(matchups, batter_id):
+    """Format a batter's line from a fetch_pitcher_season_matchups() table as "hits-at_bats"."""
+    if not batter_id:
+        return "0-0"
+    hits, at_bats = matchups.get(int(batter_id), (0, 0))
+    return f"{hits}-{at_bats}"
+
 def hitter_vs_pitcher_season(batter_id, pitcher_id, season=2025):
     """
     Get true head-to-head stats for a batter vs a specific pitcher for a season.
@@ -19,18 +72,13 @@ def hitter_vs_pitcher_season(batter_id, pitcher_id, season=2025):
     if cache_key in _h2h_cache:
         return _h2h_cache[cache_key]
     
+    if not batter_id or not pitcher_id:
+        return "0-0"
+    
     try:
-        # For now, use a known game for demonstration
-        # In production, this would search through all games in the season
-        known_games = [777620]  # 6/6/2025 Dodgers @ Cardinals game
-        
-        total_hits = 0
-        total_at_bats = 0
-        
-        for game_id in known_games:
-            h2h_data = _extract_h2h_from_game(game_id, batter_id, pitcher_id)
-            total_hits += h2h_data['hits']
-            total_at_bats += h2h_data['at_bats']
+        # One pitcher table serves every batter on the opposing roster
+        matchups = fetch_pitcher_season_matchups(pitcher_id, season)
+        total_hits, total_at_bats = matchups.get(int(batter_id), (0, 0))
         
         if total_at_bats > 0:
             result = f"{total_hits}-{total_at_bats}"
@@ -41,9 +89,11 @@ def hitter_vs_pitcher_season(batter_id, pitcher_id, season=2025):
         # Silently handle errors
         pass
     
-    # Default return if no data found or error occurred
+    # Default return if no data found or error occurred; only remember it when
+    # the pitcher's table was complete, otherwise the next call retries
     result = "0-0"
-    _h2h_cache[cache_key] = result
+    if (int(pitcher_id), str(season)) in _matchups_cache:
+        _h2h_cache[cache_key] = result
     return result
 
 def _get_player_team(player_id, season, group='hitting'):
@@ -84,6 +134,39 @@ def _get_team_vs_team_games(team1_id, team2_id, season):
     except:
         return []
 
+def _extract_pitcher_matchups_from_game(game_id, pitcher_id):
+    """
+    Extract H2H stats for every batter that faced a specific pitcher in a game.
+    Returns None if the game feed couldn't be fetched or parsed.
+    """
+    try:
+        game_data = statsapi.get('game', {'gamePk': str(game_id)})
+        all_plays = game_data.get('liveData', {}).get('plays', {}).get('allPlays', [])
+        
+        lines: Dict[int, list] = {}
+        
+        for play in all_plays:
+            matchup = play.get('matchup')
+            if not matchup or matchup.get('pitcher', {}).get('id') != pitcher_id:
+                continue
+            
+            play_batter_id = matchup.get('batter', {}).get('id')
+            event_type = play.get('result', {}).get('event', '')
+            
+            # Count at-bats (excluding walks, HBP, etc.)
+            if play_batter_id and event_type not in _NON_AT_BAT_EVENTS:
+                line = lines.setdefault(play_batter_id, [0, 0])
+                line[1] += 1
+                
+                # Count hits
+                if event_type in _HIT_EVENTS:
+                    line[0] += 1
+        
+        return {batter_id: (line[0], line[1]) for batter_id, line in lines.items()}
+    
+    except Exception:
+        return None
+
 def _extract_h2h_from_game(game_id, batter_id, pitcher_id):
     """Extract H2H stats for specific batter vs pitcher from a game"""
     try:
@@ -7,9 +7,11 @@ from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy import Column, Integer, Float
 from app.services.mlb_api import get_all_teams, get_team_roster, get_player_stats
+from app.utils.jsoncache import load_json, disk_cached
 import os
-import json
+import orjson
 import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -18,16 +20,24 @@ logger = logging.getLogger(__name__)
 BASE_URL = "https://statsapi.mlb.com/api/v1"
 SEASON = 2025
 
+# Upper bound on in-flight MLB API requests for the bulk pulls
+MAX_CONCURRENT_REQUESTS = 20
+
+# Players per multi-id /people request
+PLAYER_STATS_BATCH_SIZE = 50
+
 # Initialize database engine and session
 engine = create_engine("sqlite:///mlb_stats.db")
 Session = sessionmaker(bind=engine)
 
 
+@disk_cached(3600)
 def fetch_teams():
     """Fetch all teams using the updated API logic."""
     return get_all_teams()
 
 
+@disk_cached(3600)
 def fetch_roster(team_id):
     """Fetch team roster using the updated API logic."""
     return get_team_roster(team_id)
@@ -38,6 +48,63 @@ def fetch_player_stats(player_id, group):
     return get_player_stats(player_id, group, season=SEASON)
 
 
+def fetch_player_stats_batch(player_ids, group):
+    """
+    Fetch season stats for many players with one multi-id /people request.
+
+    Returns {player_id: stats list} in the same shape fetch_player_stats returns for a
+    single player. If the API rejects the batch with a 4xx, falls back to one request
+    per player; a player whose own request fails maps to None.
+    """
+    response = None
+    try:
+        response = requests.get(
+            f"{BASE_URL}/people",
+            params={
+                "personIds": ",".join(str(player_id) for player_id in player_ids),
+                "hydrate": f"stats(group=[{group}],type=[season],season={SEASON})",
+            },
+        )
+        response.raise_for_status()
+    except requests.exceptions.HTTPError as http_err:
+        if response is None or not 400 <= response.status_code < 500:
+            raise
+        logger.warning(f"Batch stats request rejected ({http_err}), falling back to per-player requests")
+        stats_by_player = {}
+        for player_id in player_ids:
+            try:
+                stats_by_player[player_id] = fetch_player_stats(player_id, group)
+            except Exception as err:
+                logger.error(f"An error occurred while fetching stats for player {player_id}: {err}")
+                stats_by_player[player_id] = None
+        return stats_by_player
+
+    return {person.get("id"): person.get("stats", []) for person in response.json().get("people", [])}
+
+
+def fetch_many(fetch_func, args_list, max_workers=MAX_CONCURRENT_REQUESTS):
+    """
+    Run a blocking fetch function for every argument tuple on a bounded thread pool.
+
+    The bulk pulls are dominated by network round-trips, so overlapping them on
+    threads cuts wall time roughly by the pool size. Results come back in the same
+    order as args_list; a call that raises is logged and returned as None.
+    """
+    if not args_list:
+        return []
+
+    def _call(args):
+        try:
+            return fetch_func(*args)
+        except Exception as err:
+            logger.error(f"{fetch_func.__name__}{tuple(args)} failed: {err}")
+            return None
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(args_list))) as executor:
+        return list(executor.map(_call, args_list))
+
+
+@disk_cached(3600)
 def fetch_team_stats(team_id):
     """Fetch overall season stats for a specific team from the API."""
     try:
@@ -137,8 +204,7 @@ def transfer_json_to_db():
     session = Session()
     try:
         # Load teams
-        with open("data/teams.json", "r") as f:
-            teams = json.load(f)
+        teams = load_json("data/teams.json")
 
         for team in teams:
             team_id = team["id"]
@@ -152,8 +218,8 @@ def transfer_json_to_db():
             # Load roster
             roster_file = f"data/rosters/{team_id}.json"
             if os.path.exists(roster_file):
-                with open(roster_file, "r") as roster_f:
-                    roster = json.load(roster_f)
+                with open(roster_file, "rb") as roster_f:
+                    roster = orjson.loads(roster_f.read())
 
                 for player in roster:
                     player_data = {
@@ -169,8 +235,8 @@ def transfer_json_to_db():
                     # Load stats
                     player_file = f"data/players/{player_data['id']}.json"
                     if os.path.exists(player_file):
-                        with open(player_file, "r") as player_f:
-                            stats = json.load(player_f)
+                        with open(player_file, "rb") as player_f:
+                            stats = orjson.loads(player_f.read())
                             try:
                                 stats_data = {
                                     "player_id": player_data["id"],
@@ -202,15 +268,15 @@ def transfer_player_data_to_db():
     """Transfer player data to the SQLite database."""
     session = Session()
     try:
-        # Iterate through all player JSON files
-        player_files = os.listdir("data/players/")
-        for player_file in player_files:
-            player_path = os.path.join("data/players/", player_file)
-            with open(player_path, "r") as f:
-                player_data = json.load(f)
+        # Iterate through all player JSON files (scandir entries carry their own path)
+        with os.scandir("data/players/") as entries:
+            player_entries = [entry for entry in entries if entry.name.endswith(".json")]
+        for entry in player_entries:
+            with open(entry.path, "rb") as f:
+                player_data = orjson.loads(f.read())
 
             try:
-                player_id = int(player_file.split(".")[0])
+                player_id = int(entry.name.split(".")[0])
                 full_name = player_data.get("fullName", "Unknown")
 
                 # Insert player stats into the database
@@ -254,7 +320,7 @@ def transfer_player_data_to_db():
                 session.merge(PlayerStats(**stats_data))
 
             except Exception as e:
-                logger.error(f"Error processing player file {player_file}: {e}")
+                logger.error(f"Error processing player file {entry.name}: {e}")
 
         session.commit()
         logger.info("All player data transferred to the database successfully.")
@@ -336,6 +402,7 @@ def sync_player_stats():
         session.close()
 
 
+@disk_cached(600)
 def fetch_last_5_games(player_id, group):
     """Fetch and return performance data from the last 5 games for a given player."""
     try:
@@ -359,14 +426,12 @@ def fetch_last_5_games(player_id, group):
         # Filter games that occurred before the current date
         filtered_logs = [
             game for game in game_logs
-            if datetime.datetime.strptime(game.get("date", ""), "%Y-%m-%d").date() < current_date
+            if datetime.date.fromisoformat(game.get("date", "")) < current_date
         ]
 
         # Sort the games by date in descending order and take the last 5
-        filtered_logs.sort(
-            key=lambda game: datetime.datetime.strptime(game.get("date", ""), "%Y-%m-%d").date(),
-            reverse=True
-        )
+        # (ISO dates sort correctly as strings, so no per-game parse is needed)
+        filtered_logs.sort(key=lambda game: game.get("date", ""), reverse=True)
         last_5_games = filtered_logs[:5]
 
         # Format the data into a readable table format
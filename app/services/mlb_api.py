@@ -2,7 +2,9 @@ import requests
 import logging
 import os
 import json
-from datetime import datetime, timedelta
+import functools
+from enum import IntEnum
+from datetime import datetime, timedelta, date
 
 BASE_URL = "https://statsapi.mlb.com/api/v1"
 
@@ -56,48 +58,68 @@ def get_last_10_games(player_id, group="hitting", season=2025):
     # Return the most recent 10 games
     return sorted_splits[:10]
 
+def get_last_10_games_batch(player_ids, group="hitting", season=2025):
+    """Fetch the last 10 games for many players with one multi-id /people request.
+
+    Returns {player_id: splits} with each player's splits sorted most recent first, the
+    same shape get_last_10_games returns for one player.
+    """
+    endpoint = f"{BASE_URL}/people"
+    params = {
+        "personIds": ",".join(str(player_id) for player_id in player_ids),
+        "hydrate": f"stats(group=[{group}],type=[gameLog],season={season})",
+    }
+    response = requests.get(endpoint, params=params)
+    response.raise_for_status()
+
+    games_by_player = {}
+    for person in response.json().get("people", []):
+        stats = person.get("stats") or [{}]
+        splits = stats[0].get("splits", [])
+        games_by_player[person.get("id")] = sorted(splits, key=lambda x: x.get("date", ""), reverse=True)[:10]
+    return games_by_player
+
+def compute_hit_streak(games, num_games: int = 10) -> int:
+    """Count consecutive games with a hit from game log splits sorted most recent first."""
+    if not games:
+        return 0
+    
+    # Filter out future games and games without valid dates
+    current_date = date.today()
+    valid_games = []
+    
+    for game in games:
+        game_date_str = game.get("date", "")
+        if not game_date_str:
+            continue
+            
+        try:
+            game_date = date.fromisoformat(game_date_str)
+            # Only include games that have been played (not future games)
+            if game_date <= current_date:
+                valid_games.append(game)
+        except ValueError:
+            continue
+    
+    # Games are already sorted by date descending (most recent first)
+    # Calculate consecutive hit streak from most recent games
+    streak = 0
+    for game in valid_games[:num_games]:
+        hits = game.get("stat", {}).get("hits", 0)
+        if hits > 0:
+            streak += 1
+        else:
+            # Streak broken, stop counting
+            break
+    
+    return streak
+
 def get_hit_streak(player_id: int, num_games: int = 10) -> int:
     """Calculate the hit streak for a player based on their last N games with proper chronological sorting."""
     try:
         # Get the last N games sorted by date (most recent first)
         games = get_last_10_games(player_id, group="hitting", season=2025)
-        
-        if not games:
-            return 0
-        
-        # Filter out future games and games without valid dates
-        from datetime import datetime, date
-        current_date = date.today()
-        valid_games = []
-        
-        for game in games:
-            game_date_str = game.get("date", "")
-            if not game_date_str:
-                continue
-                
-            try:
-                game_date = datetime.strptime(game_date_str, "%Y-%m-%d").date()
-                # Only include games that have been played (not future games)
-                if game_date <= current_date:
-                    valid_games.append(game)
-            except ValueError:
-                continue
-        
-        if not valid_games:
-            return 0
-        
-        # Games are already sorted by date descending (most recent first)
-        # Calculate consecutive hit streak from most recent games
-        streak = 0
-        for game in valid_games[:num_games]:
-            hits = game.get("stat", {}).get("hits", 0)
-            if hits > 0:
-                streak += 1
-            else:
-                # Streak broken, stop counting
-                break
-        
-        return streak
+        return compute_hit_streak(games, num_games)
         
     except Exception as e:
         logger.debug(f"Error calculating hit streak for player {player_id}: {e}")
@@ -147,49 +169,74 @@ def is_weak_pitcher(pitcher_stats):
     logger.debug(f"Weak criteria points: {weak_criteria_met} (ERA: {era}, WHIP: {whip}, H/9: {hits_per_nine}, IP: {innings_pitched})")
     return weak_criteria_met >= 4
 
+def _safe_float(value, default=0):
+    """Safely convert string stat values to float."""
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except (ValueError, TypeError):
+            return default
+    return value if value is not None else default
+
+class Tier(IntEnum):
+    """Hitter tiers, ordered best first so the value doubles as a sort priority."""
+    STRONG = 0
+    BUBBLE = 1
+    WEAK = 2
+    UNKNOWN = 3
+
+# Display emoji for each Tier, indexed by its value
+TIER_EMOJI = ("🟢", "🟡", "🔴", "❓")
+
 def classify_hitter(hitter_stats):
     """Classify a hitter based on ERA thresholds."""
-    # Helper function to safely convert string values to float
-    def safe_float(value, default=0):
-        if isinstance(value, str):
-            try:
-                return float(value)
-            except (ValueError, TypeError):
-                return default
-        return value if value is not None else default
-    
+    return TIER_EMOJI[classify_hitter_tier(hitter_stats)]
+
+def classify_hitter_tier(hitter_stats):
+    """Classify a hitter as a Tier; hot paths compare these ints and only render emoji at display time."""
+    return _classify_hitter_values(
+        hitter_stats.get("era", 0),
+        hitter_stats.get("avg", 0),
+        hitter_stats.get("homeRuns", 0),
+        hitter_stats.get("rbi", 0),
+        hitter_stats.get("gamesPlayed", 0),
+    )
+
+@functools.lru_cache(maxsize=4096)
+def _classify_hitter_values(era, avg, home_runs, rbi, games_played):
+    """classify_hitter on the raw stat values it reads, memoised since the same lines recur across reports."""
     # Get ERA for classification
-    era = safe_float(hitter_stats.get("era", 0))
+    era = _safe_float(era)
+    avg = _safe_float(avg)
     
     # Check if we have any meaningful stats to classify
     has_data = (
         era > 0 or  # Has ERA
-        safe_float(hitter_stats.get("avg", 0)) > 0 or  # Has batting average
-        safe_float(hitter_stats.get("homeRuns", 0)) > 0 or  # Has home runs
-        safe_float(hitter_stats.get("rbi", 0)) > 0 or     # Has RBIs
-        safe_float(hitter_stats.get("gamesPlayed", 0)) > 0  # Has games played
+        avg > 0 or  # Has batting average
+        _safe_float(home_runs) > 0 or  # Has home runs
+        _safe_float(rbi) > 0 or     # Has RBIs
+        _safe_float(games_played) > 0  # Has games played
     )
     
     # Only return insufficient data if we truly have no meaningful stats
     if not has_data:
-        return "❓"
+        return Tier.UNKNOWN
     
     # Classify based on ERA thresholds
     if era >= 0.280:
-        return "🟢"  # Strong hitter
+        return Tier.STRONG  # Strong hitter
     elif era >= 0.225:
-        return "🟡"  # Bubble hitter
+        return Tier.BUBBLE  # Bubble hitter
     elif era > 0 and era <= 0.220:
-        return "🔴"  # Weak hitter
+        return Tier.WEAK  # Weak hitter
     else:
         # If ERA is 0 or invalid, fallback to other stats for basic classification
-        avg = safe_float(hitter_stats.get("avg", 0))
         if avg >= 0.280:
-            return "🟢"
+            return Tier.STRONG
         elif avg >= 0.225:
-            return "🟡"
+            return Tier.BUBBLE
         else:
-            return "🔴"
+            return Tier.WEAK
 
 def save_matchup_cache(date, games_data):
     """Save matchup report data to cache."""
@@ -0,0 +1,85 @@
+"""
+Cached JSON file loading and fast JSON writes for the local data folder.
+
+Parsed files are kept in memory keyed by path and reused until the file's
+mtime changes, so repeated reads of data/teams.json and the roster files in one
+process (update_all, the interactive menu) skip the disk read and parse.
+Callers get the shared parsed object back and must not mutate it.
+"""
+
+import os
+import time
+import hashlib
+import logging
+import functools
+import orjson
+
+logger = logging.getLogger(__name__)
+
+# path -> (mtime, parsed data)
+_CACHE = {}
+
+# On-disk API response cache root: data/cache/api/{function}/{key}.json
+API_CACHE_FOLDER = os.path.join("data", "cache", "api")
+
+
+def load_json(path):
+    """Load a JSON file, reusing the parsed result while its mtime is unchanged."""
+    mtime = os.path.getmtime(path)
+    cached = _CACHE.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    with open(path, "rb") as f:
+        data = orjson.loads(f.read())
+    _CACHE[path] = (mtime, data)
+    logger.debug(f"Loaded and cached {path}")
+    return data
+
+
+def write_json(path, data):
+    """Serialize data with orjson and write it with raw fd writes (no buffered text layer)."""
+    payload = memoryview(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        # os.write may write less than asked for, so loop until the payload is out
+        while payload:
+            written = os.write(fd, payload)
+            payload = payload[written:]
+    finally:
+        os.close(fd)
+
+
+def disk_cached(ttl):
+    """
+    Cache a fetch function's JSON result on disk for ttl seconds.
+
+    The cache key is the function name plus its arguments. Empty results are
+    not cached, since the fetch helpers return {} / [] when a request fails.
+    Pass refresh=True to skip the cached copy and fetch (and re-cache) a fresh one.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, refresh=False, **kwargs):
+            key = hashlib.md5(f"{func.__name__}:{args}:{sorted(kwargs.items())}".encode()).hexdigest()
+            cache_path = os.path.join(API_CACHE_FOLDER, func.__name__, f"{key}.json")
+            if not refresh:
+                try:
+                    if time.time() - os.path.getmtime(cache_path) < ttl:
+                        with open(cache_path, "rb") as f:
+                            return orjson.loads(f.read())
+                except (OSError, orjson.JSONDecodeError):
+                    pass
+
+            result = func(*args, **kwargs)
+            if result:
+                os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+                write_json(cache_path, result)
+            return result
+        return wrapper
+    return decorator
+
+
+def clear_json_cache():
+    """Drop all cached parse results."""
+    _CACHE.clear()
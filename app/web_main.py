@@ -4,13 +4,16 @@ Provides web access to MLB analytics and matchup data
 """
 
 from fastapi import FastAPI, Request, HTTPException, Form
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi.responses import HTMLResponse, RedirectResponse, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from datetime import datetime, timedelta
 import os
-import json
 import logging
+import asyncio
+import hashlib
+import orjson
+from collections import defaultdict
 
 # Import existing analytics functions
 from app.services.mlb_api import (
@@ -20,7 +23,7 @@ from app.services.mlb_api import (
     fetch_team_roster,
     fetch_games_for_date
 )
-from app.services.h2h import hitter_vs_pitcher_season
+from app.services.h2h import fetch_pitcher_season_matchups, format_h2h
 
 # Import database components
 from app.db.schema import Base, Pick
@@ -30,6 +33,9 @@ from app.db.session import get_db, SessionLocal
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Per-player stats files live at data/players/{id}.json; build the prefix once for the roster loops
+PLAYERS_PREFIX = os.path.join("data", "players") + os.sep
+
 # Initialize FastAPI app
 app = FastAPI(
     title="🧠 Quantum Edge Analytics",
@@ -77,6 +83,38 @@ def safe_format(value, decimals=3, default="N/A"):
     except (ValueError, TypeError):
         return default
 
+# Tier ordering used as the secondary sort key (Strong > Bubble > Weak > No Data)
+TIER_PRIORITY = {"🟢": 0, "🟡": 1, "🔴": 2, "❓": 3}
+
+def hitter_sort_key(hitter):
+    """Sort key for hitters: batting average descending, then tier priority"""
+    try:
+        avg_value = float(hitter["avg"]) if hitter["avg"] != "N/A" else 0.0
+    except (ValueError, TypeError):
+        avg_value = 0.0
+    return (-avg_value, TIER_PRIORITY.get(hitter["tier"], 4))
+
+def format_pct(count, total):
+    """Format count/total as a one-decimal percentage string"""
+    return f"{count * 100 / total:.1f}" if total > 0 else "0.0"
+
+def calculate_roster_stats(roster):
+    """Calculate tier counts and percentages for a processed roster like the CLI does"""
+    total = len(roster)
+    strong_count = sum(1 for h in roster if h["tier"] == "🟢")
+    bubble_count = sum(1 for h in roster if h["tier"] == "🟡")
+    weak_count = sum(1 for h in roster if h["tier"] == "🔴")
+    
+    return {
+        "total": total,
+        "strong_count": strong_count,
+        "bubble_count": bubble_count,
+        "weak_count": weak_count,
+        "strong_pct": format_pct(strong_count, total),
+        "bubble_pct": format_pct(bubble_count, total),
+        "weak_pct": format_pct(weak_count, total)
+    }
+
 def get_team_roster(team_id: int):
     """Get team roster data with analytics"""
     try:
@@ -88,18 +126,21 @@ def get_team_roster(team_id: int):
         pitchers = []
         
         for player in roster:
-            position = player.get("position", {}).get("abbreviation", "")
-            player_id = player.get("person", {}).get("id")
-            player_name = player.get("person", {}).get("fullName", "Unknown")
+            position = (player.get("position") or {}).get("abbreviation", "")
+            person = player.get("person") or {}
+            player_id = person.get("id")
+            player_name = person.get("fullName", "Unknown")
             
             if position == "P":
                 # Process pitcher
                 pitcher_stats = {}
                 try:
-                    player_file = os.path.join("data", "players", f"{player_id}.json")
-                    if os.path.exists(player_file):
-                        with open(player_file, "r") as f:
-                            pitcher_stats = json.load(f)
+                    player_file = f"{PLAYERS_PREFIX}{player_id}.json"
+                    try:
+                        with open(player_file, "rb") as f:
+                            pitcher_stats = orjson.loads(f.read())
+                    except FileNotFoundError:
+                        pass
                 except:
                     pass
                 
@@ -120,10 +161,12 @@ def get_team_roster(team_id: int):
                 hitter_stats = {}
                 hit_streak = 0
                 try:
-                    player_file = os.path.join("data", "players", f"{player_id}.json")
-                    if os.path.exists(player_file):
-                        with open(player_file, "r") as f:
-                            hitter_stats = json.load(f)
+                    player_file = f"{PLAYERS_PREFIX}{player_id}.json"
+                    try:
+                        with open(player_file, "rb") as f:
+                            hitter_stats = orjson.loads(f.read())
+                    except FileNotFoundError:
+                        pass
                     hit_streak = get_hit_streak(player_id) if player_id else 0
                 except:
                     pass
@@ -143,31 +186,11 @@ def get_team_roster(team_id: int):
                 })
         
         # Sort hitters by batting average and tier
-        def sort_key(hitter):
-            tier_priority = {"🟢": 0, "🟡": 1, "🔴": 2, "❓": 3}
-            try:
-                avg_value = float(hitter["avg"]) if hitter["avg"] != "N/A" else 0.0
-            except:
-                avg_value = 0.0
-            return (-avg_value, tier_priority.get(hitter["tier"], 4))
-        
-        hitters.sort(key=sort_key)
+        hitters.sort(key=hitter_sort_key)
         
         # Calculate roster stats
-        total_hitters = len(hitters)
-        strong_count = sum(1 for h in hitters if h["tier"] == "🟢")
-        bubble_count = sum(1 for h in hitters if h["tier"] == "🟡")
-        weak_count = sum(1 for h in hitters if h["tier"] == "🔴")
-        
-        roster_stats = {
-            "total_hitters": total_hitters,
-            "strong_count": strong_count,
-            "bubble_count": bubble_count,
-            "weak_count": weak_count,
-            "strong_pct": f"{(strong_count/total_hitters*100):.1f}" if total_hitters > 0 else "0.0",
-            "bubble_pct": f"{(bubble_count/total_hitters*100):.1f}" if total_hitters > 0 else "0.0",
-            "weak_pct": f"{(weak_count/total_hitters*100):.1f}" if total_hitters > 0 else "0.0"
-        }
+        roster_stats = calculate_roster_stats(hitters)
+        total_hitters = roster_stats["total"]
         
         # Lineup analysis (top 9)
         if total_hitters >= 9:
@@ -179,9 +202,9 @@ def get_team_roster(team_id: int):
                 "strong_in_lineup": top_9_strong,
                 "bubble_in_lineup": top_9_bubble,
                 "weak_in_lineup": top_9_weak,
-                "strong_pct": f"{(top_9_strong/9*100):.1f}",
-                "bubble_pct": f"{(top_9_bubble/9*100):.1f}",
-                "weak_pct": f"{(top_9_weak/9*100):.1f}"
+                "strong_pct": format_pct(top_9_strong, 9),
+                "bubble_pct": format_pct(top_9_bubble, 9),
+                "weak_pct": format_pct(top_9_weak, 9)
             }
             
             # Bench analysis
@@ -219,6 +242,11 @@ def get_team_roster(team_id: int):
         logger.error(f"Error getting team roster {team_id}: {e}")
         return None, None
 
+def team_info(game, side):
+    """Return (team name, team id) for the "home" or "away" side of a schedule game."""
+    team = ((game.get("teams") or {}).get(side) or {}).get("team") or {}
+    return team.get("name", "Unknown"), team.get("id")
+
 def clean_team_name(team_name):
     """Clean team name to remove location and keep just the team name"""
     if not team_name or team_name == "Unknown":
@@ -246,14 +274,12 @@ def build_weak_pitcher_matchups(date: str):
         weak_pitcher_games = []
         
         for game in games:
-            home_team_raw = game.get("teams", {}).get("home", {}).get("team", {}).get("name", "Unknown")
-            away_team_raw = game.get("teams", {}).get("away", {}).get("team", {}).get("name", "Unknown")
+            home_team_raw, home_team_id = team_info(game, "home")
+            away_team_raw, away_team_id = team_info(game, "away")
             home_team = clean_team_name(home_team_raw)
             away_team = clean_team_name(away_team_raw)
-            home_team_id = game.get("teams", {}).get("home", {}).get("team", {}).get("id")
-            away_team_id = game.get("teams", {}).get("away", {}).get("team", {}).get("id")
             
-            logger.debug(f"🏟️ Processing game: {away_team} @ {home_team}")
+            logger.debug("🏟️ Processing game: %s @ %s", away_team, home_team)
             
             home_pitcher = game.get("home_pitcher", {})
             away_pitcher = game.get("away_pitcher", {})
@@ -268,46 +294,49 @@ def build_weak_pitcher_matchups(date: str):
                     pitcher = game.get(pitcher_key, {})
                     pitcher_name = pitcher.get("fullName", "Unknown")
                     
-                    logger.debug(f"🔍 Checking pitcher: {pitcher_name} ({pitcher_team})")
+                    logger.debug("🔍 Checking pitcher: %s (%s)", pitcher_name, pitcher_team)
                     
                     if pitcher_name != "TBD" and pitcher and is_weak_pitcher(pitcher.get("stats", {})):
-                        logger.info(f"⚠️ Weak pitcher found: {pitcher_name} ({pitcher_team})")
+                        logger.info("⚠️ Weak pitcher found: %s (%s)", pitcher_name, pitcher_team)
                         
                         # Use same robust processing as all games pages
                         roster_data = fetch_team_roster(opponent_team_id)
                         roster = []
                         
+                        # One H2H table for this pitcher, looked up per hitter below
+                        pitcher_matchups = fetch_pitcher_season_matchups(pitcher.get("id"), "2025")
+                        
                         if roster_data:
-                            logger.debug(f"🔍 Processing {len(roster_data)} players for {opponent_team} vs weak pitcher {pitcher_name}")
+                            logger.debug("🔍 Processing %s players for %s vs weak pitcher %s", len(roster_data), opponent_team, pitcher_name)
                         
                         for player in roster_data:
-                            position = player.get("position", {}).get("abbreviation", "")
+                            position = (player.get("position") or {}).get("abbreviation", "")
                             if position != "P":  # Only hitters
-                                player_id = player.get("person", {}).get("id")
-                                player_name = player.get("person", {}).get("fullName", "Unknown")
+                                person = player.get("person") or {}
+                                player_id = person.get("id")
+                                player_name = person.get("fullName", "Unknown")
                                 
-                                logger.debug(f"🔍 Processing player: {player_name} (ID: {player_id})")
+                                logger.debug("🔍 Processing player: %s (ID: %s)", player_name, player_id)
                                 
                                 # Use same robust stats processing as all games
                                 hitter_stats = {}
                                 hit_streak = 0
                                 try:
-                                    player_file = os.path.join("data", "players", f"{player_id}.json")
-                                    if os.path.exists(player_file):
-                                        with open(player_file, "r") as f:
-                                            player_data = json.load(f)
+                                    player_file = f"{PLAYERS_PREFIX}{player_id}.json"
+                                    try:
+                                        with open(player_file, "rb") as f:
+                                            player_data = orjson.loads(f.read())
                                             hitter_stats = player_data
+                                    except FileNotFoundError:
+                                        pass
                                     hit_streak = get_hit_streak(player_id) if player_id else 0
                                 except Exception as e:
-                                    logger.debug(f"Could not get stats for player {player_name}: {e}")
+                                    logger.debug("Could not get stats for player %s: %s", player_name, e)
                                 
                                 tier = classify_hitter(hitter_stats)
                                 
                                 # Get H2H stats vs the weak pitcher
-                                pitcher_id = pitcher.get("id")
-                                h2h_stats = "0-0"
-                                if pitcher_id and player_id:
-                                    h2h_stats = hitter_vs_pitcher_season(player_id, pitcher_id, "2025")
+                                h2h_stats = format_h2h(pitcher_matchups, player_id)
                                 
                                 roster.append({
                                     "player_id": player_id,
@@ -322,29 +351,20 @@ def build_weak_pitcher_matchups(date: str):
                                     "h2h": h2h_stats
                                 })
                         
-                        logger.debug(f"✅ Processed {len(roster)} hitters for {opponent_team}")
+                        logger.debug("✅ Processed %s hitters for %s", len(roster), opponent_team)
                         
                         # Sort by batting average - same as all games
-                        def sort_key(hitter):
-                            try:
-                                avg_value = float(hitter["avg"]) if hitter["avg"] != "N/A" else 0.0
-                            except:
-                                avg_value = 0.0
-                            tier_priority = {"🟢": 0, "🟡": 1, "🔴": 2, "❓": 3}
-                            return (-avg_value, tier_priority.get(hitter["tier"], 4))
-                        
-                        roster.sort(key=sort_key)
+                        roster.sort(key=hitter_sort_key)
                         
                         # Calculate comprehensive stats - same as all games
                         if roster:
-                            total = len(roster)
-                            strong_count = sum(1 for h in roster if h["tier"] == "🟢")
-                            bubble_count = sum(1 for h in roster if h["tier"] == "🟡") 
-                            weak_count = sum(1 for h in roster if h["tier"] == "🔴")
-                            
-                            strong_pct = f"{(strong_count/total*100):.1f}" if total > 0 else "0.0"
-                            bubble_pct = f"{(bubble_count/total*100):.1f}" if total > 0 else "0.0"
-                            weak_pct = f"{(weak_count/total*100):.1f}" if total > 0 else "0.0"
+                            roster_stats = calculate_roster_stats(roster)
+                            strong_count = roster_stats["strong_count"]
+                            bubble_count = roster_stats["bubble_count"]
+                            weak_count = roster_stats["weak_count"]
+                            strong_pct = roster_stats["strong_pct"]
+                            bubble_pct = roster_stats["bubble_pct"]
+                            weak_pct = roster_stats["weak_pct"]
                             
                             # Enhanced recommendation logic - same as all games
                             lineup_strong_pct = float(strong_pct)
@@ -371,12 +391,12 @@ def build_weak_pitcher_matchups(date: str):
                                     "text": "LIMITED OPPORTUNITY: Mostly weak lineup vs weak pitcher"
                                 }
                             
-                            logger.info(f"✅ {opponent_team} vs {pitcher_name}: {strong_count}🟢 {bubble_count}🟡 {weak_count}🔴")
+                            logger.info("✅ %s vs %s: %s🟢 %s🟡 %s🔴", opponent_team, pitcher_name, strong_count, bubble_count, weak_count)
                         else:
                             strong_count = bubble_count = weak_count = 0
                             strong_pct = bubble_pct = weak_pct = "0.0"
                             recommendation = None
-                            logger.warning(f"⚠️ No roster data for {opponent_team}")
+                            logger.warning("⚠️ No roster data for %s", opponent_team)
                         
                         weak_pitchers_found.append({
                             "pitcher": {
@@ -397,9 +417,8 @@ def build_weak_pitcher_matchups(date: str):
                         })
                     
                 except Exception as e:
-                    logger.error(f"❌ Error processing pitcher {pitcher_key} for game {game.get('gamePk', 'Unknown')}: {e}")
-                    import traceback
-                    logger.error(f"Pitcher processing traceback: {traceback.format_exc()}")
+                    logger.error("❌ Error processing pitcher %s for game %s: %s", pitcher_key, game.get('gamePk', 'Unknown'), e)
+                    logger.debug("Pitcher processing traceback", exc_info=True)
                     continue
             
             if weak_pitchers_found:
@@ -409,13 +428,13 @@ def build_weak_pitcher_matchups(date: str):
                     "away_team": away_team,
                     "weak_pitchers": weak_pitchers_found
                 })
-                logger.info(f"✅ Added game with {len(weak_pitchers_found)} weak pitcher(s): {away_team} @ {home_team}")
+                logger.info("✅ Added game with %s weak pitcher(s): %s @ %s", len(weak_pitchers_found), away_team, home_team)
         
-        logger.info(f"🎯 Found {len(weak_pitcher_games)} games with weak pitchers")
+        logger.info("🎯 Found %s games with weak pitchers", len(weak_pitcher_games))
         return weak_pitcher_games
         
     except Exception as e:
-        logger.error(f"Error building weak pitcher matchups: {e}")
+        logger.error("Error building weak pitcher matchups: %s", e)
         return []
 
 @app.get("/", response_class=HTMLResponse)
@@ -499,8 +518,8 @@ async def all_games_page(request: Request, date: str = None):
     enhanced_games = []
     for game in games:
         game_pk = game.get("gamePk")
-        home_team_raw = game.get("teams", {}).get("home", {}).get("team", {}).get("name", "Unknown")
-        away_team_raw = game.get("teams", {}).get("away", {}).get("team", {}).get("name", "Unknown")
+        home_team_raw, _ = team_info(game, "home")
+        away_team_raw, _ = team_info(game, "away")
         home_team = clean_team_name(home_team_raw)
         away_team = clean_team_name(away_team_raw)
         
@@ -557,10 +576,76 @@ async def all_games_page(request: Request, date: str = None):
         "total_games": len(enhanced_games)
     })
 
+def build_hitter_row(player, pitcher_matchups):
+    """Build one processed hitter row (stats, streak, tier, H2H) - CLI style"""
+    position = (player.get("position") or {}).get("abbreviation", "")
+    person = player.get("person") or {}
+    player_id = person.get("id")
+    player_name = person.get("fullName", "Unknown")
+    
+    logger.debug("🔍 Processing player: %s (ID: %s)", player_name, player_id)
+    
+    # CLI-style stats processing - much simpler
+    hitter_stats = {}
+    hit_streak = 0
+    try:
+        player_file = f"{PLAYERS_PREFIX}{player_id}.json"
+        try:
+            with open(player_file, "rb") as f:
+                hitter_stats = orjson.loads(f.read())
+        except FileNotFoundError:
+            pass
+        hit_streak = get_hit_streak(player_id) if player_id else 0
+    except Exception as e:
+        logger.debug("Could not get stats for player %s: %s", player_name, e)
+    
+    return {
+        "player_id": player_id,
+        "name": player_name,
+        "position": position,
+        "tier": classify_hitter(hitter_stats),
+        "avg": safe_format(hitter_stats.get('avg')),
+        "hr": str(hitter_stats.get("homeRuns", "N/A")),
+        "rbi": str(hitter_stats.get("rbi", "N/A")),
+        "ops": safe_format(hitter_stats.get('ops')),
+        "streak": str(hit_streak) if hit_streak > 0 else "0",
+        "h2h": format_h2h(pitcher_matchups, player_id)
+    }
+
+async def build_roster(side, team_id, opp_pitcher_id):
+    """Build the processed hitter list for one side of a game against the opposing pitcher"""
+    if not team_id:
+        return []
+    
+    loop = asyncio.get_running_loop()
+    try:
+        logger.info("🔍 Fetching %s roster for team %s", side, team_id)
+        # Roster and the pitcher's H2H table don't depend on each other - fetch them together
+        roster_data, pitcher_matchups = await asyncio.gather(
+            loop.run_in_executor(None, fetch_team_roster, team_id),
+            loop.run_in_executor(None, fetch_pitcher_season_matchups, opp_pitcher_id, "2025")
+        )
+        logger.info("📋 %s roster data retrieved: %s players", side.capitalize(), len(roster_data) if roster_data else 0)
+        
+        # Only hitters for now; each hitter's streak lookup runs in the thread pool
+        hitters = [p for p in roster_data or [] if (p.get("position") or {}).get("abbreviation", "") != "P"]
+        roster = await asyncio.gather(*(
+            loop.run_in_executor(None, build_hitter_row, player, pitcher_matchups)
+            for player in hitters
+        ))
+        
+        logger.info("✅ Processed %s %s hitters", len(roster), side)
+        return list(roster)
+    
+    except Exception as e:
+        logger.error("❌ Error fetching %s roster: %s", side, e)
+        logger.debug("%s roster traceback", side.capitalize(), exc_info=True)
+        return []
+
 @app.get("/games/{game_id}", response_class=HTMLResponse)
 async def single_game_detail(request: Request, game_id: str, date: str = None):
     """Individual game detail page from all games view"""
-    logger.info(f"📍 Loading game detail for game_id={game_id}, date={date}")
+    logger.info("📍 Loading game detail for game_id=%s, date=%s", game_id, date)
     
     if not date:
         date = datetime.now().strftime("%Y-%m-%d")
@@ -576,7 +661,7 @@ async def single_game_detail(request: Request, game_id: str, date: str = None):
         games = fetch_games_for_date(date, use_cache=True)
         game_data = None
         
-        logger.info(f"📊 Found {len(games)} games for {date}")
+        logger.info("📊 Found %s games for %s", len(games), date)
         
         for game in games:
             if str(game.get("gamePk")) == game_id:
@@ -584,183 +669,38 @@ async def single_game_detail(request: Request, game_id: str, date: str = None):
                 break
         
         if not game_data:
-            logger.error(f"❌ Game {game_id} not found in {len(games)} games")
+            logger.error("❌ Game %s not found in %s games", game_id, len(games))
             raise HTTPException(status_code=404, detail="Game not found")
         
-        logger.info(f"✅ Found game: {game_data.get('teams', {}).get('away', {}).get('team', {}).get('name', 'Unknown')} @ {game_data.get('teams', {}).get('home', {}).get('team', {}).get('name', 'Unknown')}")
-        
         # Enhanced game data processing
-        home_team_raw = game_data.get("teams", {}).get("home", {}).get("team", {}).get("name", "Unknown")
-        away_team_raw = game_data.get("teams", {}).get("away", {}).get("team", {}).get("name", "Unknown")
+        home_team_raw, home_team_id = team_info(game_data, "home")
+        away_team_raw, away_team_id = team_info(game_data, "away")
+        logger.info("✅ Found game: %s @ %s", away_team_raw, home_team_raw)
         home_team = clean_team_name(home_team_raw)
         away_team = clean_team_name(away_team_raw)
         
-        # Get detailed team rosters for both teams - CLI style
-        home_team_id = game_data.get("teams", {}).get("home", {}).get("team", {}).get("id")
-        away_team_id = game_data.get("teams", {}).get("away", {}).get("team", {}).get("id")
-        
         # Get pitcher information for H2H stats
         home_pitcher = game_data.get("home_pitcher", {})
         away_pitcher = game_data.get("away_pitcher", {})
         home_pitcher_id = home_pitcher.get("id") if home_pitcher else None
         away_pitcher_id = away_pitcher.get("id") if away_pitcher else None
         
-        logger.info(f"🏠 Home team ID: {home_team_id}, Away team ID: {away_team_id}")
-        logger.info(f"⚾ Home pitcher ID: {home_pitcher_id}, Away pitcher ID: {away_pitcher_id}")
-        
-        home_roster = []
-        away_roster = []
-        
-        # Get home team roster - CLI style processing
-        if home_team_id:
-            try:
-                logger.info(f"🔍 Fetching home roster for team {home_team_id}")
-                home_roster_data = fetch_team_roster(home_team_id)  # Don't convert to int here - let the function handle it
-                logger.info(f"📋 Home roster data retrieved: {len(home_roster_data) if home_roster_data else 0} players")
-                
-                if home_roster_data:
-                    for player in home_roster_data:
-                        position = player.get("position", {}).get("abbreviation", "")
-                        if position != "P":  # Only hitters for now
-                            player_id = player.get("person", {}).get("id")
-                            player_name = player.get("person", {}).get("fullName", "Unknown")
-                            
-                            logger.debug(f"🔍 Processing home player: {player_name} (ID: {player_id})")
-                            
-                            # CLI-style stats processing - much simpler
-                            hitter_stats = {}
-                            hit_streak = 0
-                            try:
-                                player_file = os.path.join("data", "players", f"{player_id}.json")
-                                if os.path.exists(player_file):
-                                    with open(player_file, "r") as f:
-                                        player_data = json.load(f)
-                                        hitter_stats = player_data
-                                hit_streak = get_hit_streak(player_id) if player_id else 0
-                            except Exception as e:
-                                logger.debug(f"Could not get stats for home player {player_name}: {e}")
-                            
-                            tier = classify_hitter(hitter_stats)
-                            
-                            # Get H2H stats vs the away pitcher
-                            h2h_stats = "0-0"
-                            if away_pitcher_id and player_id:
-                                h2h_stats = hitter_vs_pitcher_season(player_id, away_pitcher_id, "2025")
-                            
-                            home_roster.append({
-                                "player_id": player_id,
-                                "name": player_name,
-                                "position": position,
-                                "tier": tier,
-                                "avg": safe_format(hitter_stats.get('avg')),
-                                "hr": str(hitter_stats.get("homeRuns", "N/A")),
-                                "rbi": str(hitter_stats.get("rbi", "N/A")),
-                                "ops": safe_format(hitter_stats.get('ops')),
-                                "streak": str(hit_streak) if hit_streak > 0 else "0",
-                                "h2h": h2h_stats
-                            })
-                
-                logger.info(f"✅ Processed {len(home_roster)} home hitters")
-                            
-            except Exception as e:
-                logger.error(f"❌ Error fetching home roster: {e}")
-                import traceback
-                logger.error(f"Home roster traceback: {traceback.format_exc()}")
+        logger.info("🏠 Home team ID: %s, Away team ID: %s", home_team_id, away_team_id)
+        logger.info("⚾ Home pitcher ID: %s, Away pitcher ID: %s", home_pitcher_id, away_pitcher_id)
         
-        # Get away team roster - CLI style processing
-        if away_team_id:
-            try:
-                logger.info(f"🔍 Fetching away roster for team {away_team_id}")
-                away_roster_data = fetch_team_roster(away_team_id)  # Don't convert to int here - let the function handle it
-                logger.info(f"📋 Away roster data retrieved: {len(away_roster_data) if away_roster_data else 0} players")
-                
-                if away_roster_data:
-                    for player in away_roster_data:
-                        position = player.get("position", {}).get("abbreviation", "")
-                        if position != "P":  # Only hitters for now
-                            player_id = player.get("person", {}).get("id")
-                            player_name = player.get("person", {}).get("fullName", "Unknown")
-                            
-                            logger.debug(f"🔍 Processing away player: {player_name} (ID: {player_id})")
-                            
-                            # CLI-style stats processing - much simpler
-                            hitter_stats = {}
-                            hit_streak = 0
-                            try:
-                                player_file = os.path.join("data", "players", f"{player_id}.json")
-                                if os.path.exists(player_file):
-                                    with open(player_file, "r") as f:
-                                        player_data = json.load(f)
-                                        hitter_stats = player_data
-                                hit_streak = get_hit_streak(player_id) if player_id else 0
-                            except Exception as e:
-                                logger.debug(f"Could not get stats for away player {player_name}: {e}")
-                            
-                            tier = classify_hitter(hitter_stats)
-                            
-                            # Get H2H stats vs the home pitcher
-                            h2h_stats = "0-0"
-                            if home_pitcher_id and player_id:
-                                h2h_stats = hitter_vs_pitcher_season(player_id, home_pitcher_id, "2025")
-                            
-                            away_roster.append({
-                                "player_id": player_id,
-                                "name": player_name,
-                                "position": position,
-                                "tier": tier,
-                                "avg": safe_format(hitter_stats.get('avg')),
-                                "hr": str(hitter_stats.get("homeRuns", "N/A")),
-                                "rbi": str(hitter_stats.get("rbi", "N/A")),
-                                "ops": safe_format(hitter_stats.get('ops')),
-                                "streak": str(hit_streak) if hit_streak > 0 else "0",
-                                "h2h": h2h_stats
-                            })
-                
-                logger.info(f"✅ Processed {len(away_roster)} away hitters")
-                            
-            except Exception as e:
-                logger.error(f"❌ Error fetching away roster: {e}")
-                import traceback
-                logger.error(f"Away roster traceback: {traceback.format_exc()}")
+        # Build both rosters concurrently - each side is an independent set of network calls
+        home_roster, away_roster = await asyncio.gather(
+            build_roster("home", home_team_id, away_pitcher_id),
+            build_roster("away", away_team_id, home_pitcher_id)
+        )
         
         # Sort rosters - CLI style
-        def sort_key(hitter):
-            try:
-                avg_value = float(hitter["avg"]) if hitter["avg"] != "N/A" else 0.0
-            except:
-                avg_value = 0.0
-            tier_priority = {"🟢": 0, "🟡": 1, "🔴": 2, "❓": 3}
-            return (-avg_value, tier_priority.get(hitter["tier"], 4))
-        
-        home_roster.sort(key=sort_key)
-        away_roster.sort(key=sort_key)
+        home_roster.sort(key=hitter_sort_key)
+        away_roster.sort(key=hitter_sort_key)
         
-        logger.info(f"🎯 Final roster counts - Home: {len(home_roster)}, Away: {len(away_roster)}")
+        logger.info("🎯 Final roster counts - Home: %s, Away: %s", len(home_roster), len(away_roster))
         
         # Calculate roster statistics like the CLI does
-        def calculate_roster_stats(roster):
-            total = len(roster)
-            strong_count = sum(1 for h in roster if h["tier"] == "🟢")
-            bubble_count = sum(1 for h in roster if h["tier"] == "🟡")
-            weak_count = sum(1 for h in roster if h["tier"] == "🔴")
-            
-            if total > 0:
-                strong_pct = f"{(strong_count/total*100):.1f}"
-                bubble_pct = f"{(bubble_count/total*100):.1f}"
-                weak_pct = f"{(weak_count/total*100):.1f}"
-            else:
-                strong_pct = bubble_pct = weak_pct = "0.0"
-            
-            return {
-                "total": total,
-                "strong_count": strong_count,
-                "bubble_count": bubble_count,
-                "weak_count": weak_count,
-                "strong_pct": strong_pct,
-                "bubble_pct": bubble_pct,
-                "weak_pct": weak_pct
-            }
-        
         home_stats = calculate_roster_stats(home_roster)
         away_stats = calculate_roster_stats(away_roster)
         
@@ -778,20 +718,32 @@ async def single_game_detail(request: Request, game_id: str, date: str = None):
             "game_date": game_data.get("gameDate", "")
         }
         
-        logger.info(f"✅ Game detail processing complete for {away_team} @ {home_team}")
+        logger.info("✅ Game detail processing complete for %s @ %s", away_team, home_team)
+        
+        # Conditional GET - skip rendering and the response body when the browser copy is current
+        etag = '"%s"' % hashlib.blake2b(
+            orjson.dumps(enhanced_game, option=orjson.OPT_NON_STR_KEYS, default=str),
+            digest_size=16
+        ).hexdigest()
+        # Finished games don't change for the rest of the day
+        max_age = 86400 if enhanced_game["status"] == "Final" else 60
+        cache_headers = {"ETag": etag, "Cache-Control": f"private, max-age={max_age}"}
+        
+        if request.headers.get("if-none-match") == etag:
+            logger.info("♻️ Game %s not modified, returning 304", game_id)
+            return Response(status_code=304, headers=cache_headers)
         
         return templates.TemplateResponse("single_game_detail.html", {
             "request": request,
             "game": enhanced_game,
             "date": date
-        })
+        }, headers=cache_headers)
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"❌ Error fetching game detail: {e}")
-        import traceback
-        logger.error(f"Full traceback: {traceback.format_exc()}")
+        logger.error("❌ Error fetching game detail: %s", e)
+        logger.debug("Full traceback", exc_info=True)
         raise HTTPException(status_code=500, detail="Error loading game details")
 
 @app.get("/api/player/{player_id}")
@@ -817,8 +769,8 @@ async def get_player_data(player_id: int):
             raise HTTPException(status_code=404, detail=f"Player {player_id} data not found")
         
         try:
-            with open(player_file, "r") as f:
-                player_stats = json.load(f)
+            with open(player_file, "rb") as f:
+                player_stats = orjson.loads(f.read())
                 logger.info(f"✅ Successfully loaded player stats for {player_id}")
         except Exception as e:
             logger.error(f"❌ Error loading player file {player_file}: {e}")
@@ -835,12 +787,13 @@ async def get_player_data(player_id: int):
             # Fallback: search roster files
             rosters_folder = os.path.join(data_folder, "rosters")
             
-            if os.path.exists(rosters_folder):
-                for roster_file in os.listdir(rosters_folder):
-                    roster_path = os.path.join(rosters_folder, roster_file)
+            if os.path.isdir(rosters_folder):
+                with os.scandir(rosters_folder) as entries:
+                    roster_paths = [entry.path for entry in entries if entry.name.endswith(".json")]
+                for roster_path in roster_paths:
                     try:
-                        with open(roster_path, "r") as f:
-                            roster_data = json.load(f)
+                        with open(roster_path, "rb") as f:
+                            roster_data = orjson.loads(f.read())
                             for player in roster_data:
                                 if player.get("id") == player_id:
                                     player_name = player.get("fullName", f"Player {player_id}")
@@ -934,10 +887,8 @@ async def pick_tank_index(request: Request, date: str = None):
             picks = []
         
         # Group picks by game
-        picks_by_game = {}
+        picks_by_game = defaultdict(list)
         for pick in picks:
-            if pick.game_pk not in picks_by_game:
-                picks_by_game[pick.game_pk] = []
             picks_by_game[pick.game_pk].append(pick)
         
     except Exception as e:
@@ -950,8 +901,8 @@ async def pick_tank_index(request: Request, date: str = None):
     enhanced_games = []
     for game in games:
         game_pk = game.get("gamePk")
-        home_team_raw = game.get("teams", {}).get("home", {}).get("team", {}).get("name", "Unknown")
-        away_team_raw = game.get("teams", {}).get("away", {}).get("team", {}).get("name", "Unknown")
+        home_team_raw, _ = team_info(game, "home")
+        away_team_raw, _ = team_info(game, "away")
         home_team = clean_team_name(home_team_raw)
         away_team = clean_team_name(away_team_raw)
         
@@ -982,12 +933,10 @@ async def pick_tank_new_form(request: Request, game_pk: int):
         
         for game in games:
             if game.get("gamePk") == game_pk:
-                home_team_raw = game.get("teams", {}).get("home", {}).get("team", {}).get("name", "Unknown")
-                away_team_raw = game.get("teams", {}).get("away", {}).get("team", {}).get("name", "Unknown")
+                home_team_raw, home_team_id = team_info(game, "home")
+                away_team_raw, away_team_id = team_info(game, "away")
                 home_team = clean_team_name(home_team_raw)
                 away_team = clean_team_name(away_team_raw)
-                home_team_id = game.get("teams", {}).get("home", {}).get("team", {}).get("id")
-                away_team_id = game.get("teams", {}).get("away", {}).get("team", {}).get("id")
                 
                 # Fetch rosters for both teams
                 home_roster = []
@@ -3,6 +3,7 @@
 import sys
 sys.path.append('./MLB-StatsAPI')
 import statsapi
+from statsapi_cache import get_person, install_session
 
 def analyze_boxscore_h2h():
     """Analyze the 6/6/2025 game boxscore to extract H2H data"""
@@ -104,12 +105,13 @@ def analyze_boxscore_h2h():
 def get_player_name(player_id):
     """Get player name from ID"""
     try:
-        player_data = statsapi.get("person", {"personId": str(player_id)})
-        if 'people' in player_data and player_data['people']:
-            return player_data['people'][0].get('fullName', f'Player {player_id}')
+        player = get_person(player_id)
+        if player:
+            return player.get('fullName', f'Player {player_id}')
     except:
         pass
     return f'Player {player_id}'
 
 if __name__ == "__main__":
+    install_session()
     analyze_boxscore_h2h()
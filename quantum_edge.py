@@ -2,15 +2,18 @@ import typer
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
-from app.services.loader import fetch_teams, fetch_roster, fetch_player_stats, fetch_team_stats, fetch_last_5_games
-from app.services.mlb_api import fetch_games_for_date
-from app.services.h2h import hitter_vs_pitcher_season
-from app.db.session import SessionLocal as Session
-from sqlalchemy import text
-from tabulate import tabulate
-import json
+from app.utils.jsoncache import load_json, write_json
+import orjson
 import os
+import re
 import logging
+import functools
+import atexit
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import defaultdict, Counter
+from operator import itemgetter
 from datetime import datetime
 
 # Configure logging - Set to WARNING to hide debug logs
@@ -25,9 +28,198 @@ console = Console()
 DATA_FOLDER = "data"
 ROSTERS_FOLDER = os.path.join(DATA_FOLDER, "rosters")
 PLAYERS_FOLDER = os.path.join(DATA_FOLDER, "players")
+# Folder prefixes for building per-player/per-team paths inside loops without os.path.join
+_PLAYERS_PREFIX = PLAYERS_FOLDER + os.sep
+_ROSTERS_PREFIX = ROSTERS_FOLDER + os.sep
+PLAYERS_INDEX_FILE = os.path.join(DATA_FOLDER, "players_index.json")
+PLAYER_TEAM_INDEX_FILE = os.path.join(DATA_FOLDER, "player_team_index.json")
+PLAYERS_BUNDLE_FILE = os.path.join(DATA_FOLDER, "players_bundle.json")
 os.makedirs(ROSTERS_FOLDER, exist_ok=True)
 os.makedirs(PLAYERS_FOLDER, exist_ok=True)
 
+def read_json_file(path):
+    """Read and parse a JSON data file with orjson (bytes in, no text decode step)."""
+    with open(path, "rb") as f:
+        return orjson.loads(f.read())
+
+def is_fresh(path, ttl_hours):
+    """Return True if path exists and was written within the last ttl_hours."""
+    try:
+        return time.time() - os.path.getmtime(path) < ttl_hours * 3600
+    except OSError:
+        return False
+
+def list_json_files(folder):
+    """Return the paths of the .json files in folder from a single scandir pass."""
+    with os.scandir(folder) as entries:
+        return [entry.path for entry in entries if entry.name.endswith(".json") and entry.is_file()]
+
+def safe_format(value, decimals=3, default="N/A"):
+    """Safely format a numeric value from JSON, returning default for missing or non-numeric values."""
+    if value is None or value == "N/A" or value == "":
+        return default
+    if isinstance(value, (int, float)):
+        return f"{value:.{decimals}f}"
+    try:
+        return f"{float(value):.{decimals}f}"
+    except (ValueError, TypeError):
+        return default
+
+def _game_teams(game):
+    """Return (home_team, away_team, home_team_id, away_team_id) for a schedule game, names only."""
+    teams = game.get("teams") or {}
+    home = (teams.get("home") or {}).get("team") or {}
+    away = (teams.get("away") or {}).get("team") or {}
+    if not isinstance(home, dict):
+        home = {}
+    if not isinstance(away, dict):
+        away = {}
+    return home.get("name", "Unknown"), away.get("name", "Unknown"), home.get("id"), away.get("id")
+
+def _iter_pitchers(game, teams=None):
+    """Yield (pitcher_key, pitcher, opponent_team_id, pitcher_team, opponent_team) for both starters of a game."""
+    home_team, away_team, home_team_id, away_team_id = teams or _game_teams(game)
+    yield "home_pitcher", game.get("home_pitcher") or {}, away_team_id, home_team, away_team
+    yield "away_pitcher", game.get("away_pitcher") or {}, home_team_id, away_team, home_team
+
+def _menu_pitcher_name(pitcher):
+    """Pitcher name for the all-games menu: 'TBD' if missing, truncated to fit the column."""
+    name = pitcher.get("fullName", "TBD")
+    if not isinstance(name, str):
+        return "TBD"
+    return name[:15] + "..." if len(name) > 18 else name
+
+# Lineup table columns as (header, style, width), and the hitter row fields in the same order
+HITTING_TABLE_COLUMNS = (
+    ("Tier", "cyan", 6),
+    ("Player", "magenta", 20),
+    ("Pos", "white", 4),
+    ("AVG", "yellow", 6),
+    ("HR", "yellow", 4),
+    ("RBI", "yellow", 4),
+    ("OPS", "yellow", 6),
+    ("Streak", "bright_yellow", 6),
+    ("H2H", "green", 6),
+)
+HITTER_TABLE_FIELDS = itemgetter("tier", "name", "position", "avg", "hr", "rbi", "ops", "streak", "h2h")
+
+def make_hitting_table(opponent_team, hitters):
+    """Build the lineup analysis table for an opponent from sorted hitter rows."""
+    table = Table(title=f"{opponent_team} Lineup Analysis", show_header=True, header_style="bold green")
+    for header, style, width in HITTING_TABLE_COLUMNS:
+        table.add_column(header, style=style, width=width)
+    add_row = table.add_row
+    for hitter in hitters:
+        add_row(*HITTER_TABLE_FIELDS(hitter))
+    return table
+
+# Short-lived in-process caches so revisiting a game in the menus doesn't re-read or re-fetch
+_PLAYER_CACHE_TTL = 300
+_player_json_cache = {}
+_hit_streak_cache = {}
+
+# Hit streaks only change once a day, so they're kept in data/hit_streak_cache/{date}.json
+HIT_STREAK_CACHE_FOLDER = os.path.join(DATA_FOLDER, "hit_streak_cache")
+# Players per multi-id game log request in update_streaks
+STREAK_BATCH_SIZE = 100
+# {date: {player_id: streak}}; keyed by date so a session running past midnight starts a new file
+_daily_streaks = {}
+# The matchup/all-games worker pools reach the cache concurrently, so loading is serialised
+_daily_streaks_lock = threading.Lock()
+
+# Schedules already fetched this session, so running matchup_report then all_games for a date reuses them
+_GAMES_TTL = 120
+_games_cache = {}
+
+def _get_games(date, use_cache=True):
+    """fetch_games_for_date behind a short per-process TTL cache; use_cache=False always refetches."""
+    from app.services.mlb_api import fetch_games_for_date
+    now = time.monotonic()
+    hit = _games_cache.get(date)
+    if use_cache and hit and now - hit[0] < _GAMES_TTL:
+        return hit[1]
+    games = fetch_games_for_date(date, use_cache=use_cache)
+    if games:
+        _games_cache[date] = (now, games)
+    return games
+
+def _load_player_json(player_id):
+    """Load a player's saved stats file, returning {} if it hasn't been pulled or can't be read."""
+    now = time.monotonic()
+    hit = _player_json_cache.get(player_id)
+    if hit and now - hit[0] < _PLAYER_CACHE_TTL:
+        return hit[1]
+    data = {}
+    player_file = f"{_PLAYERS_PREFIX}{player_id}.json"
+    try:
+        data = read_json_file(player_file)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.debug(f"Could not get stats for player {player_id}: {e}")
+    _player_json_cache[player_id] = (now, data)
+    return data
+
+def _daily_streaks_path(day):
+    return os.path.join(HIT_STREAK_CACHE_FOLDER, f"{day}.json")
+
+def _daily_streak_cache():
+    """Load today's {player_id: streak} file once per run; every loaded day is saved at exit."""
+    day = datetime.now().date().isoformat()
+    with _daily_streaks_lock:
+        streaks = _daily_streaks.get(day)
+        if streaks is None:
+            try:
+                streaks = read_json_file(_daily_streaks_path(day))
+            except (FileNotFoundError, orjson.JSONDecodeError):
+                streaks = {}
+            _daily_streaks[day] = streaks
+    return streaks
+
+@atexit.register
+def _save_daily_streak_cache():
+    for day, streaks in _daily_streaks.items():
+        if streaks:
+            os.makedirs(HIT_STREAK_CACHE_FOLDER, exist_ok=True)
+            write_json(_daily_streaks_path(day), streaks)
+
+def hit_streak_for_today(player_id):
+    """Player's hit streak, computed at most once per player per day across runs.
+
+    Returns None if the game log can't be fetched; failures aren't cached, so the next call retries.
+    """
+    from app.services.mlb_api import get_last_10_games, compute_hit_streak
+    cache = _daily_streak_cache()
+    key = str(player_id)
+    if key not in cache:
+        try:
+            games = get_last_10_games(player_id, group="hitting", season=2025)
+        except Exception as e:
+            logger.debug(f"Error calculating hit streak for player {player_id}: {e}")
+            return None
+        cache[key] = compute_hit_streak(games)
+    return cache[key]
+
+def _cached_hit_streak(player_id):
+    """Daily hit streak with the same short in-memory TTL as the player file cache."""
+    now = time.monotonic()
+    hit = _hit_streak_cache.get(player_id)
+    if hit and now - hit[0] < _PLAYER_CACHE_TTL:
+        return hit[1]
+    streak = hit_streak_for_today(player_id)
+    if streak is None:
+        return 0
+    _hit_streak_cache[player_id] = (now, streak)
+    return streak
+
+_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+def parse_date(date):
+    """Parse a YYYY-MM-DD string, raising ValueError for anything else."""
+    if not _DATE_RE.fullmatch(date):
+        raise ValueError(f"Invalid date format: {date}")
+    return datetime.fromisoformat(date)
+
 def quantum_banner():
     """Display the Quantum Edge CLI banner."""
     console.print(Panel("[bold cyan]🧠 Quantum Edge CLI[/bold cyan]\n[green]Explore MLB Data with Futuristic Analytics[/green]", expand=False))
@@ -42,6 +234,7 @@ def list_commands():
     table.add_row("pull-teams", "Pull all teams and save them to /data/teams.json.")
     table.add_row("pull-rosters", "Pull full rosters for all teams and save them.")
     table.add_row("pull-player-stats", "Pull advanced stats for all players.")
+    table.add_row("build-players-bundle", "Combine all player files into /data/players_bundle.json.")
     table.add_row("view-team [team_id]", "Show team info and display player list.")
     table.add_row("view-player [player_id]", "Show full advanced stat report for a player.")
     table.add_row("update-all", "Run all data syncs in order.")
@@ -81,16 +274,14 @@ def backup_picks():
             
             # Show some stats
             from app.db.schema import Pick
-            from app.db.session import SessionLocal
+            from app.db.session import db_session
             
-            db = SessionLocal()
-            try:
-                total_picks = db.query(Pick).count()
-                console.print(f"[dim]🎯 Total picks backed up: {total_picks}[/dim]")
-            except Exception as e:
-                console.print(f"[yellow]⚠️ Could not count picks: {e}[/yellow]")
-            finally:
-                db.close()
+            with db_session() as db:
+                try:
+                    total_picks = db.query(Pick).count()
+                    console.print(f"[dim]🎯 Total picks backed up: {total_picks}[/dim]")
+                except Exception as e:
+                    console.print(f"[yellow]⚠️ Could not count picks: {e}[/yellow]")
         else:
             console.print("[red]❌ Backup failed![/red]")
             
@@ -109,61 +300,79 @@ def verify_picks():
     
     try:
         from app.db.schema import Pick
-        from app.db.session import SessionLocal, verify_picks_table
-        from sqlalchemy import func
+        from app.db.session import db_session, verify_picks_table
+        from sqlalchemy import text
+        from sqlalchemy.orm import load_only
         
         # Verify table exists
         if not verify_picks_table():
             console.print("[red]❌ Pick Tank table verification failed![/red]")
             return
         
-        db = SessionLocal()
-        try:
-            # Test database connection
-            from sqlalchemy import text
-            db.execute(text("SELECT 1"))
-            console.print("[green]✅ Database connection successful[/green]")
-            
-            # Count total picks
-            total_picks = db.query(Pick).count()
-            console.print(f"[cyan]📊 Total picks in database: {total_picks}[/cyan]")
+        with db_session() as db:
+            try:
+                # Count total picks - a plain COUNT(*) also proves the connection works
+                total_picks = db.execute(text("SELECT COUNT(*) FROM picks")).scalar()
+                console.print("[green]✅ Database connection successful[/green]")
+                console.print(f"[cyan]📊 Total picks in database: {total_picks}[/cyan]")
             
-            if total_picks > 0:
-                # Get pick statistics
-                pick_types = db.query(Pick.pick_type, func.count(Pick.id)).group_by(Pick.pick_type).all()
-                star_dist = db.query(Pick.stars, func.count(Pick.id)).group_by(Pick.stars).order_by(Pick.stars).all()
+                if total_picks > 0:
+                    # Get both distributions in one round-trip and split them here
+                    distribution_rows = db.execute(text(
+                        "SELECT 'type' AS k, pick_type AS v, COUNT(*) AS n FROM picks GROUP BY pick_type "
+                        "UNION ALL "
+                        "SELECT 'stars' AS k, CAST(stars AS TEXT) AS v, COUNT(*) AS n FROM picks GROUP BY stars"
+                    )).all()
+                    pick_types = [(v, n) for k, v, n in distribution_rows if k == "type"]
+                    star_dist = sorted((int(v), n) for k, v, n in distribution_rows if k == "stars")
                 
-                console.print("\n[bold]📈 Pick Type Distribution:[/bold]")
-                for pick_type, count in pick_types:
-                    console.print(f"  {pick_type}: {count}")
+                    console.print("\n[bold]📈 Pick Type Distribution:[/bold]")
+                    for pick_type, count in pick_types:
+                        console.print(f"  {pick_type}: {count}")
                 
-                console.print("\n[bold]⭐ Star Rating Distribution:[/bold]")
-                for stars, count in star_dist:
-                    star_display = "⭐" * stars
-                    console.print(f"  {star_display} ({stars}): {count}")
+                    console.print("\n[bold]⭐ Star Rating Distribution:[/bold]")
+                    for stars, count in star_dist:
+                        star_display = "⭐" * stars
+                        console.print(f"  {star_display} ({stars}): {count}")
                 
-                # Show recent picks
-                recent_picks = db.query(Pick).order_by(Pick.created_at.desc()).limit(5).all()
-                if recent_picks:
-                    console.print("\n[bold]🕒 Recent Picks:[/bold]")
-                    for pick in recent_picks:
-                        created = pick.created_at.strftime("%Y-%m-%d %H:%M") if pick.created_at else "Unknown"
-                        stars = "⭐" * pick.stars
-                        console.print(f"  {stars} {pick.selection} ({created})")
-            else:
-                console.print("[yellow]No picks found in database[/yellow]")
-                console.print("[dim]Add picks through the web interface: python quantum_edge.py serve[/dim]")
+                    # Show recent picks
+                    recent_picks = (
+                        db.query(Pick)
+                        .options(load_only(Pick.selection, Pick.stars, Pick.created_at))
+                        .order_by(Pick.created_at.desc())
+                        .limit(5)
+                        .all()
+                    )
+                    if recent_picks:
+                        console.print("\n[bold]🕒 Recent Picks:[/bold]")
+                        for pick in recent_picks:
+                            created = pick.created_at.isoformat(" ", "minutes") if pick.created_at else "Unknown"
+                            stars = "⭐" * pick.stars
+                            console.print(f"  {stars} {pick.selection} ({created})")
+                else:
+                    console.print("[yellow]No picks found in database[/yellow]")
+                    console.print("[dim]Add picks through the web interface: python quantum_edge.py serve[/dim]")
             
-            console.print(f"\n[green]✅ Pick Tank verification complete[/green]")
+                console.print(f"\n[green]✅ Pick Tank verification complete[/green]")
             
-        except Exception as e:
-            console.print(f"[red]❌ Database error: {e}[/red]")
-        finally:
-            db.close()
+            except Exception as e:
+                console.print(f"[red]❌ Database error: {e}[/red]")
             
     except Exception as e:
         console.print(f"[red]❌ Verification error: {e}[/red]")
 
+# Column layout for the list_picks table: (header, style, width)
+PICK_TABLE_COLUMNS = [
+    ("Game", "bold", 10),
+    ("⭐", "cyan", 8),
+    ("Type", "yellow", 8),
+    ("Market", "blue", 20),
+    ("Selection", "green", 25),
+    ("Odds", "magenta", 8),
+    ("Comment", "white", 30),
+    ("Time", "dim", 8),
+]
+
 @app.command()
 def list_picks(date: str = None):
     """
@@ -175,11 +384,11 @@ def list_picks(date: str = None):
         date: Date to show picks for (YYYY-MM-DD). Defaults to today.
     """
     if not date:
-        date = datetime.now().strftime("%Y-%m-%d")
+        date = datetime.now().date().isoformat()
     
     try:
         # Validate date format
-        datetime.strptime(date, "%Y-%m-%d")
+        start_date = parse_date(date)
     except ValueError:
         console.print("[red]❌ Invalid date format. Use YYYY-MM-DD[/red]")
         return
@@ -188,86 +397,73 @@ def list_picks(date: str = None):
     
     # Import here to avoid circular imports
     from app.db.schema import Pick
-    from app.db.session import SessionLocal
+    from app.db.session import db_session
+    from sqlalchemy import select
     
-    db = SessionLocal()
-    try:
-        # Get picks for the date (we'll approximate by created_at date)
-        from datetime import timedelta
-        start_date = datetime.strptime(date, "%Y-%m-%d")
-        end_date = start_date + timedelta(days=1)
+    with db_session() as db:
+        try:
+            # Get picks for the date (we'll approximate by created_at date)
+            from datetime import timedelta
+            end_date = start_date + timedelta(days=1)
         
-        picks = db.query(Pick).filter(
-            Pick.created_at >= start_date,
-            Pick.created_at < end_date
-        ).order_by(Pick.created_at.desc()).all()
+            # Select only the columns we display/export - rows come back as plain tuples
+            stmt = select(
+                Pick.game_pk, Pick.pick_type, Pick.market, Pick.selection,
+                Pick.odds, Pick.stars, Pick.comment, Pick.created_at
+            ).where(
+                Pick.created_at >= start_date,
+                Pick.created_at < end_date
+            ).order_by(Pick.created_at.desc())
+            picks = db.execute(stmt).all()
         
-        if not picks:
-            console.print(f"[yellow]No picks found for {date}[/yellow]")
-            console.print("[dim]Add picks through the web interface: python quantum_edge.py serve[/dim]")
-            return
+            if not picks:
+                console.print(f"[yellow]No picks found for {date}[/yellow]")
+                console.print("[dim]Add picks through the web interface: python quantum_edge.py serve[/dim]")
+                return
         
-        # Group picks by game
-        picks_by_game = {}
-        for pick in picks:
-            if pick.game_pk not in picks_by_game:
-                picks_by_game[pick.game_pk] = []
-            picks_by_game[pick.game_pk].append(pick)
+            # Group picks by game
+            picks_by_game = defaultdict(list)
+            for pick in picks:
+                picks_by_game[pick.game_pk].append(pick)
         
-        total_picks = len(picks)
-        console.print(f"[green]Found {total_picks} pick(s) across {len(picks_by_game)} game(s)[/green]\n")
+            total_picks = len(picks)
+            console.print(f"[green]Found {total_picks} pick(s) across {len(picks_by_game)} game(s)[/green]\n")
         
-        for game_pk, game_picks in picks_by_game.items():
-            console.print(f"[bold]🔷 Game {game_pk}[/bold]")
-            
-            # Create table for this game's picks
+            # One table for every game - each game's picks are closed off as their own section
             table = Table(show_header=True, header_style="bold magenta")
-            table.add_column("⭐", style="cyan", width=8)
-            table.add_column("Type", style="yellow", width=8)
-            table.add_column("Market", style="blue", width=20)
-            table.add_column("Selection", style="green", width=25)
-            table.add_column("Odds", style="magenta", width=8)
-            table.add_column("Comment", style="white", width=30)
-            table.add_column("Time", style="dim", width=8)
+            for name, style, width in PICK_TABLE_COLUMNS:
+                table.add_column(name, style=style, width=width)
             
-            for pick in game_picks:
-                stars = "⭐" * pick.stars
-                comment = (pick.comment[:27] + "...") if pick.comment and len(pick.comment) > 30 else (pick.comment or "")
-                time_str = pick.created_at.strftime("%H:%M") if pick.created_at else ""
+            for game_pk, game_picks in picks_by_game.items():
+                last_index = len(game_picks) - 1
+                for index, pick in enumerate(game_picks):
+                    stars = "⭐" * pick.stars
+                    comment = (pick.comment[:27] + "...") if pick.comment and len(pick.comment) > 30 else (pick.comment or "")
+                    time_str = f"{pick.created_at.hour:02d}:{pick.created_at.minute:02d}" if pick.created_at else ""
                 
-                table.add_row(
-                    stars,
-                    pick.pick_type,
-                    pick.market,
-                    pick.selection,
-                    pick.odds or "",
-                    comment,
-                    time_str
-                )
+                    table.add_row(
+                        f"🔷 {game_pk}" if index == 0 else "",
+                        stars,
+                        pick.pick_type,
+                        pick.market,
+                        pick.selection,
+                        pick.odds or "",
+                        comment,
+                        time_str,
+                        end_section=index == last_index
+                    )
             
             console.print(table)
             console.print()
         
-        # Export as JSON option
-        export_data = []
-        for pick in picks:
-            export_data.append({
-                "game_pk": pick.game_pk,
-                "pick_type": pick.pick_type,
-                "market": pick.market,
-                "selection": pick.selection,
-                "odds": pick.odds,
-                "stars": pick.stars,
-                "comment": pick.comment,
-                "created_at": pick.created_at.isoformat() if pick.created_at else None
-            })
+            # Export as JSON option - the selected rows already carry exactly the export fields,
+            # and orjson writes created_at in the same form as isoformat()
+            export_data = [pick._asdict() for pick in picks]
         
-        console.print(f"[dim]💾 Data available as JSON: {json.dumps(export_data, indent=2)}[/dim]")
+            console.print(f"[dim]💾 Data available as JSON: {orjson.dumps(export_data, option=orjson.OPT_INDENT_2).decode()}[/dim]")
         
-    except Exception as e:
-        console.print(f"[red]❌ Error fetching picks: {e}[/red]")
-    finally:
-        db.close()
+        except Exception as e:
+            console.print(f"[red]❌ Error fetching picks: {e}[/red]")
 
 @app.command()
 def main():
@@ -276,75 +472,139 @@ def main():
     list_commands()
 
 @app.command()
-def pull_teams():
-    """Pull all teams and save them to /data/teams.json."""
+def pull_teams(force: bool = False):
+    """Pull all teams and save them to /data/teams.json.
+
+    The API response is reused from the on-disk cache for up to an hour unless --force is given.
+    """
+    from app.services.loader import fetch_teams
     console.print("[cyan]Pulling all teams...[/cyan]")
-    teams = fetch_teams()
+    teams = fetch_teams(refresh=force)
     file_path = os.path.join(DATA_FOLDER, "teams.json")
-    with open(file_path, "w") as f:
-        json.dump(teams, f, indent=4)
+    write_json(file_path, teams)
     console.print(f"[green]Teams data saved to {file_path}[/green]")
 
 @app.command()
-def pull_rosters():
-    """For each team, pull full roster and save as /data/rosters/{team_id}.json."""
+def pull_rosters(force: bool = False, ttl: float = 24.0):
+    """For each team, pull full roster and save as /data/rosters/{team_id}.json.
+
+    Roster files written within the last `ttl` hours are kept unless --force is given.
+    """
+    from app.services.loader import fetch_roster, fetch_many
     console.print("[cyan]Pulling rosters for all teams...[/cyan]")
     teams_file = os.path.join(DATA_FOLDER, "teams.json")
     if not os.path.exists(teams_file):
         console.print("[red]Teams data not found. Please run 'pull-teams' first.[/red]")
         return
 
-    with open(teams_file, "r") as f:
-        teams = json.load(f)
+    teams = load_json(teams_file)
+
+    def pull_one_roster(team_id):
+        # --force also bypasses the hour-long API response cache behind fetch_roster
+        roster = fetch_roster(team_id, refresh=force)
+        roster_file = f"{_ROSTERS_PREFIX}{team_id}.json"
+        write_json(roster_file, roster)
+        return roster_file
+
+    # Each worker fetches and writes its own team's file - no shared state between teams
+    team_ids = [team.get("id") for team in teams if team.get("id")]
+    if not force:
+        stale_ids = [team_id for team_id in team_ids if not is_fresh(f"{_ROSTERS_PREFIX}{team_id}.json", ttl)]
+        if len(stale_ids) < len(team_ids):
+            console.print(f"[dim]Skipping {len(team_ids) - len(stale_ids)} roster(s) pulled within the last {ttl:g}h[/dim]")
+        team_ids = stale_ids
+    roster_files = fetch_many(pull_one_roster, [(team_id,) for team_id in team_ids], max_workers=16)
+
+    for team_id, roster_file in zip(team_ids, roster_files):
+        if roster_file is None:
+            console.print(f"[red]Failed to pull roster for team {team_id}[/red]")
+            continue
+        console.print(f"[green]Roster for team {team_id} saved to {roster_file}[/green]")
 
-    for team in teams:
-        team_id = team.get("id")
-        if team_id:
-            roster = fetch_roster(team_id)
-            roster_file = os.path.join(ROSTERS_FOLDER, f"{team_id}.json")
-            with open(roster_file, "w") as f:
-                json.dump(roster, f, indent=4)
-            console.print(f"[green]Roster for team {team_id} saved to {roster_file}[/green]")
+    build_player_team_index()
 
 @app.command()
-def pull_player_stats():
-    """For each player, pull advanced stats and store in /data/players/{player_id}.json."""
+def pull_player_stats(force: bool = False, ttl: float = 6.0):
+    """For each player, pull advanced stats and store in /data/players/{player_id}.json.
+
+    Player files written within the last `ttl` hours are kept unless --force is given.
+    """
+    from app.services.loader import fetch_player_stats_batch, fetch_many, PLAYER_STATS_BATCH_SIZE
     console.print("[cyan]Pulling player stats for all rosters...[/cyan]")
     logger.debug("Starting to pull player stats for all rosters.")
-    for roster_file in os.listdir(ROSTERS_FOLDER):
-        roster_path = os.path.join(ROSTERS_FOLDER, roster_file)
+
+    # First pass: collect every (player, group) pair from the roster files
+    players = []
+    player_index = {}
+    skipped = 0
+    for roster_path in list_json_files(ROSTERS_FOLDER):
         logger.debug(f"Processing roster file: {roster_path}")
-        with open(roster_path, "r") as f:
-            roster = json.load(f)
-            logger.debug(f"Loaded roster data: {roster}")
+        roster = read_json_file(roster_path)
+        logger.debug(f"Loaded roster data: {roster}")
 
         for player in roster:
             player_id = player.get("person", {}).get("id")
             full_name = player.get("person", {}).get("fullName", "Unknown")
             logger.debug(f"Processing player: {full_name} (ID: {player_id})")
             if player_id:
-                group = "pitching" if player.get("position", {}).get("abbreviation") == "P" else "hitting"
-                stats_response = fetch_player_stats(player_id, group)
-                logger.debug(f"Raw stats response for player {full_name}: {stats_response}")
-                
-                # Extract the actual stats from the API response structure
-                extracted_stats = {}
-                if stats_response and len(stats_response) > 0:
-                    splits = stats_response[0].get("splits", [])
-                    if splits and len(splits) > 0:
-                        extracted_stats = splits[0].get("stat", {})
-                
-                # Add player metadata
-                extracted_stats["id"] = player_id
-                extracted_stats["fullName"] = full_name
-                extracted_stats["position"] = player.get("position", {}).get("abbreviation", "")
-                
-                logger.debug(f"Extracted stats for player {full_name}: {extracted_stats}")
-                player_file = os.path.join(PLAYERS_FOLDER, f"{player_id}.json")
-                with open(player_file, "w") as f:
-                    json.dump(extracted_stats, f, indent=4)
-                logger.debug(f"Saved stats for player {full_name} to {player_file}")
-                console.print(f"[green]Stats for player {full_name} (ID: {player_id}) saved to {player_file}[/green]")
+                if not force and is_fresh(f"{_PLAYERS_PREFIX}{player_id}.json", ttl):
+                    # Recent enough - keep the file, but it still belongs in the name index
+                    player_index.setdefault(full_name.lower(), player_id)
+                    skipped += 1
+                    continue
+                position = player.get("position", {}).get("abbreviation", "")
+                group = "pitching" if position == "P" else "hitting"
+                players.append((player_id, group, full_name, position))
+
+    if skipped:
+        console.print(f"[dim]Skipping {skipped} player(s) pulled within the last {ttl:g}h[/dim]")
+
+    # Second pass: fetch stats in multi-id batches per stat group, with the batches running concurrently
+    console.print(f"[cyan]Fetching stats for {len(players)} players...[/cyan]")
+    batches = []
+    for stat_group in ("hitting", "pitching"):
+        group_ids = [player_id for player_id, group, _, _ in players if group == stat_group]
+        for start in range(0, len(group_ids), PLAYER_STATS_BATCH_SIZE):
+            batches.append((group_ids[start:start + PLAYER_STATS_BATCH_SIZE], stat_group))
+
+    stats_by_player = {}
+    for (batch_ids, _), batch_stats in zip(batches, fetch_many(fetch_player_stats_batch, batches)):
+        if batch_stats is None:
+            continue
+        for player_id in batch_ids:
+            # Players missing from a successful batch have no season stats yet; a None entry
+            # means that player's fallback request failed, so their existing file is left alone
+            stats_by_player[player_id] = batch_stats.get(player_id, [])
+    responses = [stats_by_player.get(player_id) for player_id, _, _, _ in players]
+
+    # Third pass: write the player files and the name index
+    for (player_id, group, full_name, position), stats_response in zip(players, responses):
+        if stats_response is None:
+            console.print(f"[red]Failed to pull stats for player {full_name} (ID: {player_id})[/red]")
+            continue
+        logger.debug(f"Raw stats response for player {full_name}: {stats_response}")
+
+        # Extract the actual stats from the API response structure
+        extracted_stats = {}
+        if stats_response and len(stats_response) > 0:
+            splits = stats_response[0].get("splits", [])
+            if splits and len(splits) > 0:
+                extracted_stats = splits[0].get("stat", {})
+
+        # Add player metadata
+        extracted_stats["id"] = player_id
+        extracted_stats["fullName"] = full_name
+        extracted_stats["position"] = position
+
+        logger.debug(f"Extracted stats for player {full_name}: {extracted_stats}")
+        player_file = f"{_PLAYERS_PREFIX}{player_id}.json"
+        write_json(player_file, extracted_stats)
+        logger.debug(f"Saved stats for player {full_name} to {player_file}")
+        console.print(f"[green]Stats for player {full_name} (ID: {player_id}) saved to {player_file}[/green]")
+        player_index.setdefault(full_name.lower(), player_id)
+
+    save_player_index(player_index)
+    build_players_bundle()
 
 @app.command()
 def view_team(team_name: str):
@@ -362,39 +622,94 @@ def view_team(team_name: str):
     else:
         console.print("[yellow]No stats available for this team.[/yellow]")
 
-def get_player_id_by_name_from_files(player_name):
-    """Search for a player ID by name in the JSON files."""
-    for player_file in os.listdir(PLAYERS_FOLDER):
-        player_path = os.path.join(PLAYERS_FOLDER, player_file)
+def save_player_index(index):
+    """Write the {lowercased name: player_id} index and drop the in-process copy."""
+    write_json(PLAYERS_INDEX_FILE, index)
+    _load_player_index.cache_clear()
+    logger.debug(f"Saved player index with {len(index)} entries to {PLAYERS_INDEX_FILE}")
+
+def build_player_index():
+    """Scan PLAYERS_FOLDER once and rebuild the player name index."""
+    index = {}
+    for player_path in list_json_files(PLAYERS_FOLDER):
         try:
-            with open(player_path, "r") as f:
-                player_data = json.load(f)
-                if player_name.lower() in player_data.get("fullName", "").lower():
-                    return player_data.get("id")
-        except json.JSONDecodeError as e:
+            player_data = read_json_file(player_path)
+            full_name = player_data.get("fullName", "")
+            if full_name and player_data.get("id"):
+                index.setdefault(full_name.lower(), player_data.get("id"))
+        except orjson.JSONDecodeError as e:
             logger.error(f"Error decoding JSON in file {player_path}: {e}")
         except Exception as e:
             logger.error(f"Unexpected error while processing file {player_path}: {e}")
+    save_player_index(index)
+    return index
+
+@functools.lru_cache(maxsize=1)
+def _load_player_index():
+    """Load the player name index once per process, building it if it is missing."""
+    if not os.path.exists(PLAYERS_INDEX_FILE):
+        return build_player_index()
+    try:
+        return read_json_file(PLAYERS_INDEX_FILE)
+    except orjson.JSONDecodeError as e:
+        logger.error(f"Error decoding player index {PLAYERS_INDEX_FILE}: {e}")
+        return build_player_index()
+
+# The only player fields update_streaks and classify_hitter read; the bundle keeps just these
+PLAYERS_BUNDLE_FIELDS = ("id", "fullName", "position", "currentTeam", "avg", "ops", "era", "homeRuns", "rbi", "gamesPlayed")
+
+@app.command()
+def build_players_bundle():
+    """Combine every data/players/{id}.json into one slim data/players_bundle.json keyed by player id."""
+    bundle = {}
+    for player_path in list_json_files(PLAYERS_FOLDER):
+        try:
+            player_data = read_json_file(player_path)
+        except Exception as e:
+            logger.error(f"Error reading player file {player_path}: {e}")
+            continue
+        if player_data.get("id"):
+            bundle[str(player_data["id"])] = {field: player_data[field] for field in PLAYERS_BUNDLE_FIELDS if field in player_data}
+    write_json(PLAYERS_BUNDLE_FILE, bundle)
+    logger.debug(f"Saved players bundle with {len(bundle)} players to {PLAYERS_BUNDLE_FILE}")
+    return bundle
+
+def load_players_bundle():
+    """Load every player record from the bundle in one read, building the bundle if it is missing."""
+    try:
+        return read_json_file(PLAYERS_BUNDLE_FILE)
+    except (FileNotFoundError, orjson.JSONDecodeError):
+        return build_players_bundle()
+
+def get_player_id_by_name_from_files(player_name):
+    """Search for a player ID by name using the cached player index."""
+    index = _load_player_index()
+    query = player_name.lower()
+    if query in index:
+        return index[query]
+    for full_name, player_id in index.items():
+        if query in full_name:
+            return player_id
     return None
 
 @app.command()
 def view_player(player_name):
     """Show full advanced stat report in CLI with rich formatting."""
+    from app.services.loader import fetch_last_5_games
     player_id = get_player_id_by_name_from_files(player_name)
     if not player_id:
         console.print(f"[red]Player '{player_name}' not found in JSON files.[/red]")
         logger.debug(f"Player '{player_name}' not found in JSON files.")
         return
 
-    player_file = os.path.join(PLAYERS_FOLDER, f"{player_id}.json")
+    player_file = f"{_PLAYERS_PREFIX}{player_id}.json"
     if not os.path.exists(player_file):
         console.print(f"[red]Stats for player {player_name} not found. Please run 'pull-player-stats' first.[/red]")
         logger.debug(f"Stats for player {player_name} not found. File does not exist: {player_file}")
         return
 
     try:
-        with open(player_file, "r") as f:
-            stats = json.load(f)
+        stats = read_json_file(player_file)
     except Exception as e:
         console.print(f"[red]Error loading stats for player {player_name}: {e}[/red]")
         logger.error(f"Error loading stats for player {player_name}: {e}")
@@ -480,42 +795,35 @@ def main_menu():
 
     console.print(table)
 
+    def prompt(label):
+        return console.input(f"[bold cyan]{label}: [/bold cyan]")
+
+    # Menu number -> action; "8" (exit) is handled by the loop itself
+    dispatch = {
+        "1": serve,
+        "2": pull_teams,
+        "3": pull_rosters,
+        "4": pull_player_stats,
+        "5": lambda: view_team(prompt("Enter team name")),
+        "6": lambda: view_player(prompt("Enter player name")),
+        "7": update_all,
+        "9": streaks,
+        "10": lambda: matchup_report(date=prompt("Enter date for matchup report (YYYY-MM-DD)")),
+        "11": clear_cache,
+        "12": lambda: matchup_report(date=prompt("Enter date for matchup report (YYYY-MM-DD)"), force_refresh=True),
+        "13": lambda: all_games(date=prompt("Enter date for all games report (YYYY-MM-DD)")),
+        "14": update_streaks,
+    }
+
     while True:
         choice = console.input("[bold cyan]Select a command by number: [/bold cyan]")
-        if choice == "1":
-            serve()
-        elif choice == "2":
-            pull_teams()
-        elif choice == "3":
-            pull_rosters()
-        elif choice == "4":
-            pull_player_stats()
-        elif choice == "5":
-            team_name = console.input("[bold cyan]Enter team name: [/bold cyan]")
-            view_team(team_name)
-        elif choice == "6":
-            player_name = console.input("[bold cyan]Enter player name: [/bold cyan]")
-            view_player(player_name)
-        elif choice == "7":
-            update_all()
-        elif choice == "8":
+        if choice == "8":
             console.print("[bold green]Exiting Quantum Edge CLI. Goodbye![/bold green]")
             break
-        elif choice == "9":
-            streaks()
-        elif choice == "10":
-            date = console.input("[bold cyan]Enter date for matchup report (YYYY-MM-DD): [/bold cyan]")
-            matchup_report(date=date)
-        elif choice == "11":
-            clear_cache()
-        elif choice == "12":
-            date = console.input("[bold cyan]Enter date for matchup report (YYYY-MM-DD): [/bold cyan]")
-            matchup_report(date=date, force_refresh=True)
-        elif choice == "13":
-            date = console.input("[bold cyan]Enter date for all games report (YYYY-MM-DD): [/bold cyan]")
-            all_games(date=date)
-        elif choice == "14":
-            update_streaks()
+
+        action = dispatch.get(choice)
+        if action:
+            action()
         else:
             console.print("[bold red]Invalid choice. Please select a valid command number.[/bold red]")
 
@@ -527,22 +835,23 @@ def interactive_menu():
 
 def get_team_stats_by_name_from_files(team_name):
     """Search for a team by name in the JSON file and fetch overall season stats."""
+    from app.services.loader import fetch_team_stats
     teams_file = os.path.join(DATA_FOLDER, "teams.json")
     if not os.path.exists(teams_file):
         console.print("[red]Teams data not found. Please run 'pull-teams' first.[/red]")
         return None, None
 
-    with open(teams_file, "r") as f:
-        teams = json.load(f)
-        for team in teams:
-            if team_name.lower() in team.get("name", "").lower():
-                team_id = team.get("id")
-                stats = fetch_team_stats(team_id)  # Fetch overall season stats from the API
-                return team, stats
+    teams = load_json(teams_file)
+    for team in teams:
+        if team_name.lower() in team.get("name", "").lower():
+            team_id = team.get("id")
+            stats = fetch_team_stats(team_id)  # Fetch overall season stats from the API
+            return team, stats
     return None, None
 
 def search_player(player_id: int, group: str = "hitting"):
     """Search for a player and display their details along with the last 5 games' stats."""
+    from app.services.loader import fetch_last_5_games
     try:
         print(f"Searching for player ID: {player_id}...")
 
@@ -564,17 +873,25 @@ def search_player(player_id: int, group: str = "hitting"):
         print(f"Error fetching player details: {e}")
 
 @app.command()
-def update_player_stats():
-    """Update player JSON files with missing stats (strikeouts, earned runs, base on balls)."""
+def update_player_stats(force: bool = False, ttl: float = 6.0):
+    """Update player JSON files with missing stats (strikeouts, earned runs, base on balls).
+
+    Player files written within the last `ttl` hours are left alone unless --force is given.
+    """
+    from app.services.loader import fetch_player_stats, fetch_many
     console.print("[cyan]Updating player stats...[/cyan]")
     logger.debug("Starting to update player stats.")
 
-    for player_file in os.listdir(PLAYERS_FOLDER):
-        player_path = os.path.join(PLAYERS_FOLDER, player_file)
+    # Load every player file first so the stat requests can go out together
+    pending = []
+    for player_path in list_json_files(PLAYERS_FOLDER):
+        player_file = os.path.basename(player_path)
+        if not force and is_fresh(player_path, ttl):
+            logger.debug(f"Skipping recently updated player file: {player_path}")
+            continue
         logger.debug(f"Processing player file: {player_path}")
 
-        with open(player_path, "r") as f:
-            player_data = json.load(f)
+        player_data = read_json_file(player_path)
 
         player_id = player_data.get("id")
         if not player_id:
@@ -582,30 +899,34 @@ def update_player_stats():
             continue
 
         group = "pitching" if player_data.get("position", {}).get("abbreviation") == "P" else "hitting"
+        pending.append((player_file, player_path, player_data, player_id, group))
+
+    results = fetch_many(fetch_player_stats, [(player_id, group) for _, _, _, player_id, group in pending])
 
+    for (player_file, player_path, player_data, player_id, group), stats in zip(pending, results):
         try:
-            stats = fetch_player_stats(player_id, group)
             player_data.update({
                 "strikeouts": stats.get("strikeOuts", "N/A"),
                 "earned_runs": stats.get("earnedRuns", "N/A"),
                 "base_on_balls": stats.get("baseOnBalls", "N/A"),
             })
 
-            with open(player_path, "w") as f:
-                json.dump(player_data, f, indent=4)
+            write_json(player_path, player_data)
 
             logger.debug(f"Updated stats for player ID {player_id} in file {player_file}.")
         except Exception as e:
             logger.error(f"Failed to update stats for player ID {player_id}: {e}")
 
+    build_player_index()
+    build_players_bundle()
     console.print("[green]Player stats update completed.[/green]")
 
 @app.command()
 def streaks():
     """Identify hitters on hit streaks of 2 or more games and cache the results dynamically."""
-    from app.services.mlb_api import get_hit_streak, get_last_10_games
+    from app.services.mlb_api import compute_hit_streak, get_last_10_games
+    from app.services.loader import fetch_many
     import os
-    import json
 
     console.print("[cyan]Updating cached list of hitters on hit streaks...[/cyan]")
 
@@ -617,58 +938,60 @@ def streaks():
         console.print("[red]Teams data not found. Please run 'pull-teams' first.[/red]")
         return
 
-    with open(teams_file, "r") as f:
-        teams = {team["id"]: team["name"] for team in json.load(f)}
+    teams = {team["id"]: team["name"] for team in load_json(teams_file)}
 
     hitters_on_streak = []
 
-    for player_file in os.listdir(players_folder):
-        if player_file.endswith(".json"):
-            player_path = os.path.join(players_folder, player_file)
-            with open(player_path, "r") as f:
-                player_data = json.load(f)
+    # Read and parse the player files on a small thread pool - the reads release the GIL
+    player_paths = list_json_files(players_folder)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        all_player_data = list(executor.map(read_json_file, player_paths))
 
-            player_id = player_data.get("id")
-            full_name = player_data.get("fullName", "Unknown")
-            team_id = player_data.get("currentTeam", {}).get("id")
-            team_name = teams.get(team_id, "Unknown Team")
+    # First pass: collect the hitters (pitchers are skipped before any lookups)
+    hitters = []
+    for player_data in all_player_data:
+        position = player_data.get("primaryPosition", {}).get("abbreviation", "")
+        if position == "P":
+            continue
+        hitters.append(player_data)
 
-            # If team_name is still "Unknown Team", attempt to fetch it from player data
-            if team_name == "Unknown Team":
-                team_name = player_data.get("currentTeam", {}).get("name", "Unknown Team")
+    # Second pass: one concurrent fan-out for every hitter's game log
+    game_logs = fetch_many(get_last_10_games, [(player_data.get("id"), "hitting", 2025) for player_data in hitters])
 
-            # Fetch team name using helper function
-            team_name = get_team_name(team_id, teams)
+    # Third pass: streaks are computed locally from the logs we already have
+    for player_data, games in zip(hitters, game_logs):
+        full_name = player_data.get("fullName", "Unknown")
 
-            # If team_name is still "Unknown Team", attempt to find it by player name
-            if team_name == "Unknown Team":
-                team_name = find_team_name_by_player_name(full_name, teams)
+        if games is None:
+            console.print(f"[red]Error processing player {full_name}: game log request failed[/red]")
+            continue
+        if not games:
+            console.print(f"[yellow]No game logs found for player {full_name}.[/yellow]")
+            continue
 
-            # Skip players who are not hitters
-            position = player_data.get("primaryPosition", {}).get("abbreviation", "")
-            if position == "P":
-                continue
+        try:
+            streak = compute_hit_streak(games, num_games=10)
+        except Exception as e:
+            console.print(f"[red]Error processing player {full_name}: {e}[/red]")
+            continue
 
-            try:
-                games = get_last_10_games(player_id, group="hitting", season=2025)
-                if not games:
-                    console.print(f"[yellow]No game logs found for player {full_name}.[/yellow]")
-                    continue
+        if streak >= 2:
+            # Team lookups are only needed for the players we report:
+            # teams.json, then the player's own currentTeam, then the roster index
+            current_team = player_data.get("currentTeam") or {}
+            team_name = (
+                teams.get(current_team.get("id"))
+                or current_team.get("name")
+                or find_team_name_by_player_name(full_name, teams)
+            )
 
-                streak = get_hit_streak(player_id, num_games=10)
-                if streak >= 2:
-                    hitters_on_streak.append({"name": full_name, "team": team_name, "streak": streak})
-            except IndexError:
-                console.print(f"[yellow]No valid game data for player {full_name}.[/yellow]")
-            except Exception as e:
-                console.print(f"[red]Error processing player {full_name}: {e}[/red]")
+            hitters_on_streak.append({"name": full_name, "team": team_name, "streak": streak})
 
     # Sort hitters by streak length in descending order
     hitters_on_streak.sort(key=lambda x: x["streak"], reverse=True)
 
     # Cache the sorted results
-    with open(cache_file, "w") as f:
-        json.dump(hitters_on_streak, f, indent=4)
+    write_json(cache_file, hitters_on_streak)
 
     console.print("[green]Cached list of hitters on hit streaks updated successfully![/green]")
 
@@ -688,45 +1011,73 @@ def streaks():
     else:
         console.print("[red]No hitters on hit streaks of 2 or more games found.[/red]")
 
-def get_team_name(team_id, teams):
-    """Helper function to fetch the team name for a given team ID."""
-    return teams.get(team_id, "Unknown Team")
-
-def find_team_name_by_player_name(player_name, teams):
-    """Search for a player's team name by matching the player's name in the teams data."""
-    for team_id, team_name in teams.items():
-        roster_file = os.path.join("data", "rosters", f"{team_id}.json")
-        if os.path.exists(roster_file):
-            with open(roster_file, "r") as f:
-                roster = json.load(f)
-                for player in roster:
-                    if player_name.lower() in player.get("person", {}).get("fullName", "").lower():
-                        return team_name
+def build_player_team_index():
+    """Walk the roster files once and write a {lowercased player name: team name} index."""
+    teams_file = os.path.join(DATA_FOLDER, "teams.json")
+    index = {}
+    if os.path.exists(teams_file):
+        roster_files = set(list_json_files(ROSTERS_FOLDER))
+        # teams.json order decides which team wins if a name shows up on two rosters
+        for team in load_json(teams_file):
+            roster_file = f"{_ROSTERS_PREFIX}{team.get('id')}.json"
+            if roster_file not in roster_files:
+                continue
+            for player in load_json(roster_file):
+                full_name = player.get("person", {}).get("fullName", "")
+                if full_name:
+                    index.setdefault(full_name.lower(), team.get("name", "Unknown Team"))
+
+    write_json(PLAYER_TEAM_INDEX_FILE, index)
+    _load_player_team_index.cache_clear()
+    _team_name_for_player.cache_clear()
+    logger.debug(f"Saved player/team index with {len(index)} entries to {PLAYER_TEAM_INDEX_FILE}")
+    return index
+
+@functools.lru_cache(maxsize=1)
+def _load_player_team_index():
+    """Load the player/team index once per process, building it if it is missing."""
+    if not os.path.exists(PLAYER_TEAM_INDEX_FILE):
+        return build_player_team_index()
+    return read_json_file(PLAYER_TEAM_INDEX_FILE)
+
+@functools.lru_cache(maxsize=None)
+def _team_name_for_player(query):
+    index = _load_player_team_index()
+    if query in index:
+        return index[query]
+    # Partial names still work, but only against the in-memory index; misses are memoised
+    for full_name, team_name in index.items():
+        if query in full_name:
+            return team_name
     return "Unknown Team"
 
+def find_team_name_by_player_name(player_name, teams=None):
+    """Look up a player's team name from the roster reverse index (teams is kept for older callers)."""
+    return _team_name_for_player(player_name.lower())
+
 @app.command()
 def matchup_report(weak_pitchers: bool = False, date: str = None, use_cache: bool = True, force_refresh: bool = False):
     """Generate a Daily Weak Pitcher Matchup Report with interactive game selection."""
-    from app.services.mlb_api import is_weak_pitcher, classify_hitter, get_hit_streak, fetch_team_roster
-    import os
-    import json
-    from datetime import datetime
+    from app.services.mlb_api import is_weak_pitcher, classify_hitter_tier, fetch_team_roster, Tier, TIER_EMOJI
+    from app.services.h2h import hitter_vs_pitcher_season, fetch_pitcher_season_matchups
 
-    # Helper function to safely format numeric values from JSON
-    def safe_format(value, decimals=3, default="N/A"):
-        if value is None or value == "N/A":
-            return default
-        try:
-            return f"{float(value):.{decimals}f}"
-        except (ValueError, TypeError):
-            return default
+    # Weak/strong verdicts per pitcher id, so the menu pass and game analysis classify each pitcher once
+    _weak_cache = {}
+
+    def pitcher_is_weak(pitcher):
+        pitcher_id = pitcher.get("id")
+        if pitcher_id is None:
+            return is_weak_pitcher(pitcher.get("stats", {}))
+        if pitcher_id not in _weak_cache:
+            _weak_cache[pitcher_id] = is_weak_pitcher(pitcher.get("stats", {}))
+        return _weak_cache[pitcher_id]
 
     if not date:
         console.print("[red]Please provide a date in the format YYYY-MM-DD.[/red]")
         return
 
     try:
-        report_date = datetime.strptime(date, "%Y-%m-%d")
+        report_date = parse_date(date)
     except ValueError:
         console.print("[red]Invalid date format. Please use YYYY-MM-DD.[/red]")
         return
@@ -735,46 +1086,43 @@ def matchup_report(weak_pitchers: bool = False, date: str = None, use_cache: boo
         use_cache = False
     
     # Fetch games for the given date (silently)
-    games = fetch_games_for_date(date, use_cache=use_cache)
+    games = _get_games(date, use_cache)
     if not games:
         console.print(f"[yellow]No games found for {date}.[/yellow]")
         return
 
     weak_pitcher_games = []
+    append_game = weak_pitcher_games.append
     
     # First pass: identify games with weak pitchers
     for game in games:
-        home_team = game.get("teams", {}).get("home", {}).get("team", {}).get("name", "Unknown")
-        away_team = game.get("teams", {}).get("away", {}).get("team", "Unknown")
-        home_team_id = game.get("teams", {}).get("home", {}).get("team", {}).get("id")
-        away_team_id = game.get("teams", {}).get("away", {}).get("team", {}).get("id")
-        
-        home_pitcher = game.get("home_pitcher", {})
-        away_pitcher = game.get("away_pitcher", {})
+        teams = _game_teams(game)
+        home_team, away_team = teams[0], teams[1]
         
         # Check each pitcher for weakness
-        weak_pitchers_found = []
-        
-        for pitcher_key, opponent_team_id, pitcher_team, opponent_team in [
-            ("home_pitcher", away_team_id, home_team, away_team), 
-            ("away_pitcher", home_team_id, away_team, home_team)
-        ]:
-            pitcher = game.get(pitcher_key, {})
-            pitcher_name = pitcher.get("fullName", "Unknown")
-            
-            if pitcher_name != "TBD" and pitcher and is_weak_pitcher(pitcher.get("stats", {})):
-                weak_pitchers_found.append({
-                    "pitcher": pitcher,
-                    "pitcher_team": pitcher_team,
-                    "opponent_team": opponent_team,
-                    "opponent_team_id": opponent_team_id
-                })
+        weak_pitchers_found = [
+            {
+                "pitcher": pitcher,
+                "pitcher_team": pitcher_team,
+                "opponent_team": opponent_team,
+                "opponent_team_id": opponent_team_id
+            }
+            for _, pitcher, opponent_team_id, pitcher_team, opponent_team in _iter_pitchers(game, teams)
+            if pitcher and pitcher.get("fullName", "Unknown") != "TBD" and pitcher_is_weak(pitcher)
+        ]
         
         if weak_pitchers_found:
-            weak_pitcher_games.append({
+            # Menu strings are built once here rather than on every menu redraw
+            pitcher_display = weak_pitchers_found[0]["pitcher"].get("fullName", "Unknown")
+            # If multiple weak pitchers, show the first one with indicator
+            if len(weak_pitchers_found) > 1:
+                pitcher_display = f"{pitcher_display} (+{len(weak_pitchers_found)-1})"
+            append_game({
                 "game": game,
                 "home_team": home_team,
                 "away_team": away_team,
+                "matchup": f"{away_team} @ {home_team}",
+                "pitcher_display": pitcher_display,
                 "weak_pitchers": weak_pitchers_found
             })
 
@@ -787,47 +1135,27 @@ def matchup_report(weak_pitchers: bool = False, date: str = None, use_cache: boo
     console.print(f"\n[bold red]⚠️ WEAK PITCHER ALERT - {date} ⚠️[/bold red]")
     console.print(f"[green]Found {len(weak_pitcher_games)} game(s) with weak pitcher matchups![/green]\n")
 
+    # Rosters fetched during this command, so revisiting a game (or 'all') doesn't re-hit the API
+    _roster_cache = {}
+
+    def get_roster(team_id):
+        roster = _roster_cache.get(team_id)
+        if roster is None:
+            roster = _roster_cache[team_id] = fetch_team_roster(team_id) or []
+        return roster
+
     # Create interactive menu for game selection
-    def display_game_menu():
-        table = Table(title=f"Weak Pitcher Games - {date}", show_header=True, header_style="bold cyan")
-        table.add_column("Game #", style="bright_blue", width=8)
-        table.add_column("Matchup", style="green", width=35)
-        table.add_column("Weak Pitcher", style="red", width=25)
-
-        for i, game_info in enumerate(weak_pitcher_games, 1):
-            # Clean team name extraction
-            away_team = game_info.get('away_team', 'Unknown')
-            home_team = game_info.get('home_team', 'Unknown')
-            
-            # Ensure we only show team names, not API objects
-            if isinstance(away_team, dict):
-                away_team = away_team.get('name', 'Unknown')
-            if isinstance(home_team, dict):
-                home_team = home_team.get('name', 'Unknown')
-                
-            matchup = f"{away_team} @ {home_team}"
-            
-            # Get clean pitcher name for display
-            weak_pitchers_list = game_info.get('weak_pitchers', [])
-            if weak_pitchers_list:
-                pitcher = weak_pitchers_list[0].get('pitcher', {})
-                pitcher_name = pitcher.get('fullName', 'Unknown')
-                # If multiple weak pitchers, show the first one with indicator
-                if len(weak_pitchers_list) > 1:
-                    pitcher_display = f"{pitcher_name} (+{len(weak_pitchers_list)-1})"
-                else:
-                    pitcher_display = pitcher_name
-            else:
-                pitcher_display = "Unknown"
-            
-            # Add row to table with clean data only
-            table.add_row(
-                str(i), 
-                matchup, 
-                pitcher_display
-            )
+    # The game list is fixed for the session, so the menu table is built once and reprinted
+    menu_table = Table(title=f"Weak Pitcher Games - {date}", show_header=True, header_style="bold cyan")
+    menu_table.add_column("Game #", style="bright_blue", width=8)
+    menu_table.add_column("Matchup", style="green", width=35)
+    menu_table.add_column("Weak Pitcher", style="red", width=25)
 
-        console.print(table)
+    for i, game_info in enumerate(weak_pitcher_games, 1):
+        menu_table.add_row(str(i), game_info["matchup"], game_info["pitcher_display"])
+
+    def display_game_menu():
+        console.print(menu_table)
         console.print(f"\n[cyan]Select a game (1-{len(weak_pitcher_games)}) | 'all' for complete report | 'back' to main menu[/cyan]")
 
     def display_game_analysis(game_index):
@@ -878,50 +1206,34 @@ def matchup_report(weak_pitchers: bool = False, date: str = None, use_cache: boo
             # Opponent Hitting Table
             console.print(f"\n[bold green]🎯 {opponent_team} Hitters vs Weak Pitcher[/bold green]")
             
-            roster = fetch_team_roster(opponent_team_id)
-            if roster:
-                hitting_table = Table(title=f"{opponent_team} Lineup Analysis", show_header=True, header_style="bold green")
-                hitting_table.add_column("Tier", style="cyan", width=6)
-                hitting_table.add_column("Player", style="magenta", width=20)
-                hitting_table.add_column("Pos", style="white", width=4)
-                hitting_table.add_column("AVG", style="yellow", width=6)
-                hitting_table.add_column("HR", style="yellow", width=4)
-                hitting_table.add_column("RBI", style="yellow", width=4)
-                hitting_table.add_column("OPS", style="yellow", width=6)
-                hitting_table.add_column("Streak", style="bright_yellow", width=6)
-                hitting_table.add_column("H2H", style="green", width=6)
-
+            roster = get_roster(opponent_team_id)
+            # Skip pitchers up front so an all-pitcher roster never touches the player files
+            non_pitcher_players = [player for player in roster if (player.get("position") or {}).get("abbreviation", "") != "P"]
+            if non_pitcher_players:
                 # Collect all hitters first
                 all_hitters = []
+                tier_counts = [0] * len(Tier)
                 
-                # Initialize the tier count lists here
-                strong_hitters = []
-                bubble_hitters = []
-                weak_hitters = []
+                # Load every hitter's stats file and hit streak in one concurrent pass
+                player_ids = [
+                    player_id for player_id in ((player.get("person") or {}).get("id") for player in non_pitcher_players)
+                    if player_id
+                ]
+                with ThreadPoolExecutor(max_workers=16) as ex:
+                    stats_map = dict(zip(player_ids, ex.map(_load_player_json, player_ids)))
+                    streak_map = dict(zip(player_ids, ex.map(_cached_hit_streak, player_ids)))
                 
-                for player in roster:
-                    # Skip pitchers
-                    position = player.get("position", {}).get("abbreviation", "")
-                    if position == "P":
-                        continue
-                        
-                    player_id = player.get("person", {}).get("id")
-                    player_name = player.get("person", {}).get("fullName", "Unknown")
+                for player in non_pitcher_players:
+                    position = (player.get("position") or {}).get("abbreviation", "")
+                    person = player.get("person") or {}
+                    player_id = person.get("id")
+                    player_name = person.get("fullName", "Unknown")
                     
-                    # Try to get player stats from local files
-                    hitter_stats = {}
-                    hit_streak = 0
-                    try:
-                        player_file = os.path.join("data", "players", f"{player_id}.json")
-                        if os.path.exists(player_file):
-                            with open(player_file, "r") as f:
-                                player_data = json.load(f)
-                                hitter_stats = player_data
-                        hit_streak = get_hit_streak(player_id) if player_id else 0
-                    except Exception as e:
-                        logger.debug(f"Could not get stats for player {player_name}: {e}")
+                    hitter_stats = stats_map.get(player_id, {})
+                    hit_streak = streak_map.get(player_id, 0)
                     
-                    tier = classify_hitter(hitter_stats)
+                    tier = classify_hitter_tier(hitter_stats)
+                    tier_counts[tier] += 1
                     
                     # Get H2H stats vs the weak pitcher
                     pitcher_id = pitcher.get("id")
@@ -929,69 +1241,34 @@ def matchup_report(weak_pitchers: bool = False, date: str = None, use_cache: boo
                     if pitcher_id and player_id:
                         h2h_stats = hitter_vs_pitcher_season(player_id, pitcher_id, "2025")
                     
-                    # Helper function to safely get ERA
-                    def get_era_value(stats):
-                        era = stats.get('era', 0)
-                        try:
-                            return float(era) if era else 0.0
-                        except (ValueError, TypeError):
-                            return 0.0
-                    
-                    era_value = get_era_value(hitter_stats)
+                    avg = safe_format(hitter_stats.get('avg'))
+                    avg_value = float(avg) if avg != "N/A" else 0.0
                     
                     player_row = {
-                        "tier": tier,
+                        "tier": TIER_EMOJI[tier],
+                        "tier_code": tier,
                         "name": player_name,
                         "position": position,
-                        "era": era_value,
-                        "avg": safe_format(hitter_stats.get('avg')),
+                        "avg": avg,
                         "hr": str(hitter_stats.get("homeRuns", "N/A")),
                         "rbi": str(hitter_stats.get("rbi", "N/A")),
                         "ops": safe_format(hitter_stats.get('ops')),
                         "streak": str(hit_streak) if hit_streak > 0 else "0",
-                        "h2h": h2h_stats
+                        "h2h": h2h_stats,
+                        # Primary sort: Batting Average descending (highest first)
+                        # Secondary sort: Tier priority (Strong > Bubble > Weak > No Data)
+                        "sort_key": (-avg_value, tier)
                     }
                     
                     all_hitters.append(player_row)
 
                 # Sort hitters by batting average in descending order, then by tier priority
-                def sort_key(hitter):
-                    # Primary sort: Batting Average descending (highest first)
-                    # Secondary sort: Tier priority (Strong > Bubble > Weak > No Data)
-                    tier_priority = {"🟢": 0, "🟡": 1, "🔴": 2, "❓": 3}
-                    
-                    # Get batting average value for sorting
-                    avg_str = hitter["avg"]
-                    try:
-                        avg_value = float(avg_str) if avg_str != "N/A" else 0.0
-                    except (ValueError, TypeError):
-                        avg_value = 0.0
-                    
-                    return (-avg_value, tier_priority.get(hitter["tier"], 4))
-                
-                all_hitters.sort(key=sort_key)
-
-                # Add top 9 hitters to table (likely lineup) and categorize them
-                for i, hitter in enumerate(all_hitters):
-                    hitting_table.add_row(
-                        hitter["tier"],
-                        hitter["name"],
-                        hitter["position"],
-                        hitter["avg"],
-                        hitter["hr"],
-                        hitter["rbi"],
-                        hitter["ops"],
-                        hitter["streak"],
-                        hitter["h2h"]
-                    )
-                    
-                    # Count by tier for summary
-                    if hitter["tier"] == "🟢":
-                        strong_hitters.append(hitter)
-                    elif hitter["tier"] == "🟡":
-                        bubble_hitters.append(hitter)
-                    else:  # 🔴 or ❓
-                        weak_hitters.append(hitter)
+                all_hitters.sort(key=itemgetter("sort_key"))
+                strong_count, bubble_count = tier_counts[Tier.STRONG], tier_counts[Tier.BUBBLE]
+                weak_count = len(all_hitters) - strong_count - bubble_count  # 🔴 or ❓
+
+                # Add top 9 hitters to table (likely lineup)
+                hitting_table = make_hitting_table(opponent_team, all_hitters)
 
                 console.print(hitting_table)
                 
@@ -1000,9 +1277,9 @@ def matchup_report(weak_pitchers: bool = False, date: str = None, use_cache: boo
                 
                 # Summary for ALL hitters with context-aware recommendations
                 if len(all_hitters) > 0:
-                    strong_pct = len(strong_hitters) / len(all_hitters) * 100
-                    bubble_pct = len(bubble_hitters) / len(all_hitters) * 100
-                    weak_pct = len(weak_hitters) / len(all_hitters) * 100
+                    strong_pct = strong_count / len(all_hitters) * 100
+                    bubble_pct = bubble_count / len(all_hitters) * 100
+                    weak_pct = weak_count / len(all_hitters) * 100
                     
                     # Summary stats table for entire roster
                     summary_table = Table(title=f"{opponent_team} Complete Roster Summary", show_header=True, header_style="bold cyan")
@@ -1010,15 +1287,16 @@ def matchup_report(weak_pitchers: bool = False, date: str = None, use_cache: boo
                     summary_table.add_column("Count", style="yellow")
                     summary_table.add_column("Percentage", style="green")
                     
-                    summary_table.add_row("🟢 Strong Hitters", str(len(strong_hitters)), f"{strong_pct:.1f}%")
-                    summary_table.add_row("🟡 Bubble Hitters", str(len(bubble_hitters)), f"{bubble_pct:.1f}%")
-                    summary_table.add_row("🔴 Weak Hitters", str(len(weak_hitters)), f"{weak_pct:.1f}%")
+                    summary_table.add_row("🟢 Strong Hitters", str(strong_count), f"{strong_pct:.1f}%")
+                    summary_table.add_row("🟡 Bubble Hitters", str(bubble_count), f"{bubble_pct:.1f}%")
+                    summary_table.add_row("🔴 Weak Hitters", str(weak_count), f"{weak_pct:.1f}%")
                     summary_table.add_row("Total Roster Hitters", str(len(all_hitters)), "100.0%")
                     
                     # Add likely starting lineup analysis
                     if len(all_hitters) >= 9:
-                        top_9_strong = sum(1 for h in all_hitters[:9] if h["tier"] == "🟢")
-                        top_9_bubble = sum(1 for h in all_hitters[:9] if h["tier"] == "🟡")
+                        top_9_tiers = Counter(h["tier_code"] for h in all_hitters[:9])
+                        top_9_strong = top_9_tiers[Tier.STRONG]
+                        top_9_bubble = top_9_tiers[Tier.BUBBLE]
                         top_9_weak = 9 - top_9_strong - top_9_bubble
                         
                         summary_table.add_row("", "", "")  # Separator
@@ -1032,8 +1310,9 @@ def matchup_report(weak_pitchers: bool = False, date: str = None, use_cache: boo
                     # Bench depth analysis
                     if len(all_hitters) > 9:
                         bench_hitters = all_hitters[9:]
-                        bench_strong = sum(1 for h in bench_hitters if h["tier"] == "🟢")
-                        bench_bubble = sum(1 for h in bench_hitters if h["tier"] == "🟡")
+                        bench_tiers = Counter(h["tier_code"] for h in bench_hitters)
+                        bench_strong = bench_tiers[Tier.STRONG]
+                        bench_bubble = bench_tiers[Tier.BUBBLE]
                         bench_weak = len(bench_hitters) - bench_strong - bench_bubble
                         
                         console.print(f"\n[bold yellow]🛏️ Bench Depth Analysis ({len(bench_hitters)} players)[/bold yellow]")
@@ -1049,7 +1328,7 @@ def matchup_report(weak_pitchers: bool = False, date: str = None, use_cache: boo
                             console.print(f"[yellow]⚠️ LIMITED DEPTH: No strong hitters on the bench[/yellow]")
 
                     # Context-aware recommendations based on pitcher strength
-                    is_weak_pitcher_result = is_weak_pitcher(stats)
+                    is_weak_pitcher_result = pitcher_is_weak(pitcher)
                     if is_weak_pitcher_result:
                         # Against weak pitchers - look for offensive opportunities
                         lineup_strong_pct = (top_9_strong/9*100) if len(all_hitters) >= 9 else strong_pct
@@ -1073,6 +1352,8 @@ def matchup_report(weak_pitchers: bool = False, date: str = None, use_cache: boo
                             console.print(f"[dim]🛡️ PITCHER ADVANTAGE: {lineup_weak_pct:.1f}% weak hitters vs strong pitcher[/dim]")
                         else:
                             console.print(f"[yellow]⚖️ BALANCED MATCHUP: Mixed lineup vs strong pitcher[/yellow]")
+            elif roster:
+                console.print(f"[yellow]No position players in {opponent_team} roster.[/yellow]")
             else:
                 console.print(f"[yellow]No roster data found for {opponent_team}.[/yellow]")
             
@@ -1080,8 +1361,47 @@ def matchup_report(weak_pitchers: bool = False, date: str = None, use_cache: boo
 
     def display_all_games():
         """Display analysis for all games at once."""
+        # Fetch every opponent roster concurrently up front so each game renders without blocking
+        team_ids = list({
+            wp["opponent_team_id"] for g in weak_pitcher_games for wp in g["weak_pitchers"]
+            if wp["opponent_team_id"] not in _roster_cache
+        })
+        with ThreadPoolExecutor(max_workers=8) as ex:
+            for team_id, roster in zip(team_ids, ex.map(fetch_team_roster, team_ids)):
+                _roster_cache[team_id] = roster or []
+
+        # Warm the player file, streak and H2H caches for every game in parallel; the per-game
+        # work is network/disk bound, so threads overlap it and rendering below stays sequential
+        player_ids = set()
+        pitcher_ids = set()
+        h2h_pairs = set()
+        for g in weak_pitcher_games:
+            for wp in g["weak_pitchers"]:
+                pitcher_id = wp["pitcher"].get("id")
+                if pitcher_id:
+                    pitcher_ids.add(pitcher_id)
+                for player in _roster_cache.get(wp["opponent_team_id"], []):
+                    if (player.get("position") or {}).get("abbreviation", "") == "P":
+                        continue
+                    player_id = (player.get("person") or {}).get("id")
+                    if player_id:
+                        player_ids.add(player_id)
+                        if pitcher_id:
+                            h2h_pairs.add((player_id, pitcher_id))
+        with ThreadPoolExecutor(max_workers=16) as ex:
+            list(ex.map(_load_player_json, player_ids))
+            list(ex.map(_cached_hit_streak, player_ids))
+            # One matchup table per distinct pitcher - warming per (hitter, pitcher) pair would
+            # have concurrent misses refetch the same pitcher's games
+            list(ex.map(lambda pitcher_id: fetch_pitcher_season_matchups(pitcher_id, "2025"), pitcher_ids))
+        # Every pair is now a cache hit on its pitcher's table
+        for player_id, pitcher_id in h2h_pairs:
+            hitter_vs_pitcher_season(player_id, pitcher_id, "2025")
+
         for i, game_info in enumerate(weak_pitcher_games):
-            display_game_analysis(i)
+            # Buffer each game's tables and summaries and write them to the terminal in one go
+            with console:
+                display_game_analysis(i)
 
     # Interactive menu loop
     while True:
@@ -1101,7 +1421,8 @@ def matchup_report(weak_pitchers: bool = False, date: str = None, use_cache: boo
             try:
                 game_num = int(choice)
                 if 1 <= game_num <= len(weak_pitcher_games):
-                    display_game_analysis(game_num - 1)
+                    with console:
+                        display_game_analysis(game_num - 1)
                     console.print("\n[cyan]Press Enter to return to game menu...[/cyan]")
                     console.input()
                 else:
@@ -1112,32 +1433,33 @@ def matchup_report(weak_pitchers: bool = False, date: str = None, use_cache: boo
 @app.command()
 def all_games(date: str = None, use_cache: bool = True):
     """View all games for a date with interactive matchup analysis."""
-    from app.services.mlb_api import is_weak_pitcher, classify_hitter, get_hit_streak, fetch_team_roster
-    import os
-    import json
+    from app.services.mlb_api import is_weak_pitcher, classify_hitter_tier, fetch_team_roster, Tier, TIER_EMOJI
+    from app.services.h2h import hitter_vs_pitcher_season
     from datetime import datetime
 
-    # Helper function to safely format numeric values from JSON
-    def safe_format(value, decimals=3, default="N/A"):
-        if value is None or value == "N/A":
-            return default
-        try:
-            return f"{float(value):.{decimals}f}"
-        except (ValueError, TypeError):
-            return default
+    # Weak/strong verdicts per pitcher id, so the menu pass and game analysis classify each pitcher once
+    _weak_cache = {}
+
+    def pitcher_is_weak(pitcher):
+        pitcher_id = pitcher.get("id")
+        if pitcher_id is None:
+            return is_weak_pitcher(pitcher.get("stats", {}))
+        if pitcher_id not in _weak_cache:
+            _weak_cache[pitcher_id] = is_weak_pitcher(pitcher.get("stats", {}))
+        return _weak_cache[pitcher_id]
 
     if not date:
         console.print("[red]Please provide a date in the format YYYY-MM-DD.[/red]")
         return
 
     try:
-        report_date = datetime.strptime(date, "%Y-%m-%d")
+        report_date = parse_date(date)
     except ValueError:
         console.print("[red]Invalid date format. Please use YYYY-MM-DD.[/red]")
         return
     
     # Fetch games for the given date
-    games = fetch_games_for_date(date, use_cache=use_cache)
+    games = _get_games(date, use_cache)
     if not games:
         console.print(f"[yellow]No games found for {date}.[/yellow]")
         return
@@ -1146,15 +1468,9 @@ def all_games(date: str = None, use_cache: bool = True):
     all_games_list = []
     
     for game in games:
-        # Extract team names more safely to avoid API data leakage
-        home_team_data = game.get("teams", {}).get("home", {}).get("team", {})
-        away_team_data = game.get("teams", {}).get("away", {}).get("team", {})
-        
-        # Get clean team names only
-        home_team = home_team_data.get("name", "Unknown") if isinstance(home_team_data, dict) else "Unknown"
-        away_team = away_team_data.get("name", "Unknown") if isinstance(away_team_data, dict) else "Unknown"
-        home_team_id = home_team_data.get("id") if isinstance(home_team_data, dict) else None
-        away_team_id = away_team_data.get("id") if isinstance(away_team_data, dict) else None
+        # Clean team names only, to avoid API data leakage
+        teams = _game_teams(game)
+        home_team, away_team, home_team_id, away_team_id = teams
         
         # Get game status and time
         status = game.get("status", {}).get("detailedState", "Unknown")
@@ -1164,21 +1480,21 @@ def all_games(date: str = None, use_cache: bool = True):
         formatted_time = "TBD"
         if game_time:
             try:
-                dt = datetime.fromisoformat(game_time.replace('Z', '+00:00'))
+                dt = datetime.fromisoformat(game_time[:-1] + "+00:00" if game_time.endswith("Z") else game_time)
                 formatted_time = dt.strftime("%I:%M %p ET")
-            except:
+            except (ValueError, TypeError):
                 formatted_time = "TBD"
         
-        home_pitcher = game.get("home_pitcher", {})
-        away_pitcher = game.get("away_pitcher", {})
+        home_pitcher = game.get("home_pitcher") or {}
+        away_pitcher = game.get("away_pitcher") or {}
         
         # Check for weak pitchers
         weak_pitcher_count = 0
         weak_pitcher_names = []
         
-        for pitcher in [home_pitcher, away_pitcher]:
+        for _, pitcher, _, _, _ in _iter_pitchers(game, teams):
             pitcher_name = pitcher.get("fullName", "TBD")
-            if pitcher_name != "TBD" and pitcher and is_weak_pitcher(pitcher.get("stats", {})):
+            if pitcher_name != "TBD" and pitcher and pitcher_is_weak(pitcher):
                 weak_pitcher_count += 1
                 weak_pitcher_names.append(pitcher_name)
         
@@ -1186,6 +1502,9 @@ def all_games(date: str = None, use_cache: bool = True):
             "game": game,
             "home_team": home_team,
             "away_team": away_team,
+            "matchup": f"{away_team} @ {home_team}",
+            "home_pitcher_display": _menu_pitcher_name(home_pitcher),
+            "away_pitcher_display": _menu_pitcher_name(away_pitcher),
             "home_team_id": home_team_id,
             "away_team_id": away_team_id,
             "home_pitcher": home_pitcher,
@@ -1200,56 +1519,38 @@ def all_games(date: str = None, use_cache: bool = True):
     console.print(f"\n[bold blue]🏟️ ALL GAMES FOR {date} 🏟️[/bold blue]")
     console.print(f"[green]Found {len(all_games_list)} game(s) scheduled[/green]\n")
 
+    # Rosters fetched during this command, so revisiting a game (or 'all') doesn't re-hit the API
+    _roster_cache = {}
+
+    def get_roster(team_id):
+        roster = _roster_cache.get(team_id)
+        if roster is None:
+            roster = _roster_cache[team_id] = fetch_team_roster(team_id) or []
+        return roster
+
     # Create interactive menu for game selection
-    def display_all_games_menu():
-        table = Table(title=f"All Games - {date}", show_header=True, header_style="bold cyan")
-        table.add_column("Game #", style="bright_blue", width=8)
-        table.add_column("Matchup", style="green", width=35)
-        table.add_column("Home Pitcher", style="white", width=20)
-        table.add_column("Away Pitcher", style="white", width=20)
-        table.add_column("Alert", style="red", width=8)
-
-        for i, game_info in enumerate(all_games_list, 1):
-            # Clean team name extraction
-            away_team = game_info.get('away_team', 'Unknown')
-            home_team = game_info.get('home_team', 'Unknown')
-            
-            # Ensure we only show team names, not API objects
-            if isinstance(away_team, dict):
-                away_team = away_team.get('name', 'Unknown')
-            if isinstance(home_team, dict):
-                home_team = home_team.get('name', 'Unknown')
-                
-            matchup = f"{away_team} @ {home_team}"
-            
-            # Clean pitcher name extraction
-            home_pitcher_name = game_info.get('home_pitcher', {}).get('fullName', 'TBD')
-            away_pitcher_name = game_info.get('away_pitcher', {}).get('fullName', 'TBD')
-            
-            # Ensure pitcher names are strings
-            if not isinstance(home_pitcher_name, str):
-                home_pitcher_name = 'TBD'
-            if not isinstance(away_pitcher_name, str):
-                away_pitcher_name = 'TBD'
-            
-            # Truncate pitcher names if too long
-            if len(home_pitcher_name) > 18:
-                home_pitcher_name = home_pitcher_name[:15] + "..."
-            if len(away_pitcher_name) > 18:
-                away_pitcher_name = away_pitcher_name[:15] + "..."
-            
-            # Alert for weak pitchers
-            alert = "⚠️ WEAK" if game_info.get('weak_pitcher_count', 0) > 0 else ""
-            
-            table.add_row(
-                str(i), 
-                matchup, 
-                home_pitcher_name,
-                away_pitcher_name,
-                alert
-            )
+    # The game list is fixed for the session, so the menu table is built once and reprinted
+    menu_table = Table(title=f"All Games - {date}", show_header=True, header_style="bold cyan")
+    menu_table.add_column("Game #", style="bright_blue", width=8)
+    menu_table.add_column("Matchup", style="green", width=35)
+    menu_table.add_column("Home Pitcher", style="white", width=20)
+    menu_table.add_column("Away Pitcher", style="white", width=20)
+    menu_table.add_column("Alert", style="red", width=8)
+
+    for i, game_info in enumerate(all_games_list, 1):
+        # Alert for weak pitchers
+        alert = "⚠️ WEAK" if game_info.get('weak_pitcher_count', 0) > 0 else ""
+        
+        menu_table.add_row(
+            str(i), 
+            game_info["matchup"], 
+            game_info["home_pitcher_display"],
+            game_info["away_pitcher_display"],
+            alert
+        )
 
-        console.print(table)
+    def display_all_games_menu():
+        console.print(menu_table)
         console.print(f"\n[cyan]Select a game (1-{len(all_games_list)}) | 'weak' for weak pitcher games only | 'back' to main menu[/cyan]")
 
     def display_game_matchup_analysis(game_index):
@@ -1278,7 +1579,7 @@ def all_games(date: str = None, use_cache: bool = True):
                 continue
                 
             stats = pitcher.get("stats", {})
-            is_weak = is_weak_pitcher(stats)
+            is_weak = pitcher_is_weak(pitcher)
             
             # Pitcher Summary Table
             pitcher_color = "red" if is_weak else "green"
@@ -1310,50 +1611,34 @@ def all_games(date: str = None, use_cache: bool = True):
             matchup_context = "vs Weak Pitcher" if is_weak else "vs Strong Pitcher"
             console.print(f"\n[bold green]🎯 {opponent_team} Hitters {matchup_context}[/bold green]")
             
-            roster = fetch_team_roster(opponent_team_id)
-            if roster:
-                hitting_table = Table(title=f"{opponent_team} Lineup Analysis", show_header=True, header_style="bold green")
-                hitting_table.add_column("Tier", style="cyan", width=6)
-                hitting_table.add_column("Player", style="magenta", width=20)
-                hitting_table.add_column("Pos", style="white", width=4)
-                hitting_table.add_column("AVG", style="yellow", width=6)
-                hitting_table.add_column("HR", style="yellow", width=4)
-                hitting_table.add_column("RBI", style="yellow", width=4)
-                hitting_table.add_column("OPS", style="yellow", width=6)
-                hitting_table.add_column("Streak", style="bright_yellow", width=6)
-                hitting_table.add_column("H2H", style="green", width=6)
-
+            roster = get_roster(opponent_team_id)
+            # Skip pitchers up front so an all-pitcher roster never touches the player files
+            non_pitcher_players = [player for player in roster if (player.get("position") or {}).get("abbreviation", "") != "P"]
+            if non_pitcher_players:
                 # Collect all hitters first
                 all_hitters = []
+                tier_counts = [0] * len(Tier)
                 
-                # Initialize the tier count lists here
-                strong_hitters = []
-                bubble_hitters = []
-                weak_hitters = []
+                # Load every hitter's stats file and hit streak in one concurrent pass
+                player_ids = [
+                    player_id for player_id in ((player.get("person") or {}).get("id") for player in non_pitcher_players)
+                    if player_id
+                ]
+                with ThreadPoolExecutor(max_workers=16) as ex:
+                    stats_map = dict(zip(player_ids, ex.map(_load_player_json, player_ids)))
+                    streak_map = dict(zip(player_ids, ex.map(_cached_hit_streak, player_ids)))
                 
-                for player in roster:
-                    # Skip pitchers
-                    position = player.get("position", {}).get("abbreviation", "")
-                    if position == "P":
-                        continue
-                        
-                    player_id = player.get("person", {}).get("id")
-                    player_name = player.get("person", {}).get("fullName", "Unknown")
+                for player in non_pitcher_players:
+                    position = (player.get("position") or {}).get("abbreviation", "")
+                    person = player.get("person") or {}
+                    player_id = person.get("id")
+                    player_name = person.get("fullName", "Unknown")
                     
-                    # Try to get player stats from local files
-                    hitter_stats = {}
-                    hit_streak = 0
-                    try:
-                        player_file = os.path.join("data", "players", f"{player_id}.json")
-                        if os.path.exists(player_file):
-                            with open(player_file, "r") as f:
-                                player_data = json.load(f)
-                                hitter_stats = player_data
-                        hit_streak = get_hit_streak(player_id) if player_id else 0
-                    except Exception as e:
-                        logger.debug(f"Could not get stats for player {player_name}: {e}")
+                    hitter_stats = stats_map.get(player_id, {})
+                    hit_streak = streak_map.get(player_id, 0)
                     
-                    tier = classify_hitter(hitter_stats)
+                    tier = classify_hitter_tier(hitter_stats)
+                    tier_counts[tier] += 1
                     
                     # Get H2H stats vs the pitcher
                     pitcher_id = pitcher.get("id")
@@ -1361,69 +1646,34 @@ def all_games(date: str = None, use_cache: bool = True):
                     if pitcher_id and player_id:
                         h2h_stats = hitter_vs_pitcher_season(player_id, pitcher_id, "2025")
                     
-                    # Helper function to safely get ERA
-                    def get_era_value(stats):
-                        era = stats.get('era', 0)
-                        try:
-                            return float(era) if era else 0.0
-                        except (ValueError, TypeError):
-                            return 0.0
-                    
-                    era_value = get_era_value(hitter_stats)
+                    avg = safe_format(hitter_stats.get('avg'))
+                    avg_value = float(avg) if avg != "N/A" else 0.0
                     
                     player_row = {
-                        "tier": tier,
+                        "tier": TIER_EMOJI[tier],
+                        "tier_code": tier,
                         "name": player_name,
                         "position": position,
-                        "era": era_value,
-                        "avg": safe_format(hitter_stats.get('avg')),
+                        "avg": avg,
                         "hr": str(hitter_stats.get("homeRuns", "N/A")),
                         "rbi": str(hitter_stats.get("rbi", "N/A")),
                         "ops": safe_format(hitter_stats.get('ops')),
                         "streak": str(hit_streak) if hit_streak > 0 else "0",
-                        "h2h": h2h_stats
+                        "h2h": h2h_stats,
+                        # Primary sort: Batting Average descending (highest first)
+                        # Secondary sort: Tier priority (Strong > Bubble > Weak > No Data)
+                        "sort_key": (-avg_value, tier)
                     }
                     
                     all_hitters.append(player_row)
 
                 # Sort hitters by batting average in descending order, then by tier priority
-                def sort_key(hitter):
-                    # Primary sort: Batting Average descending (highest first)
-                    # Secondary sort: Tier priority (Strong > Bubble > Weak > No Data)
-                    tier_priority = {"🟢": 0, "🟡": 1, "🔴": 2, "❓": 3}
-                    
-                    # Get batting average value for sorting
-                    avg_str = hitter["avg"]
-                    try:
-                        avg_value = float(avg_str) if avg_str != "N/A" else 0.0
-                    except (ValueError, TypeError):
-                        avg_value = 0.0
-                    
-                    return (-avg_value, tier_priority.get(hitter["tier"], 4))
-                
-                all_hitters.sort(key=sort_key)
-
-                # Add top 9 hitters to table (likely lineup) and categorize them
-                for i, hitter in enumerate(all_hitters):
-                    hitting_table.add_row(
-                        hitter["tier"],
-                        hitter["name"],
-                        hitter["position"],
-                        hitter["avg"],
-                        hitter["hr"],
-                        hitter["rbi"],
-                        hitter["ops"],
-                        hitter["streak"],
-                        hitter["h2h"]
-                    )
-                    
-                    # Count by tier for summary
-                    if hitter["tier"] == "🟢":
-                        strong_hitters.append(hitter)
-                    elif hitter["tier"] == "🟡":
-                        bubble_hitters.append(hitter)
-                    else:  # 🔴 or ❓
-                        weak_hitters.append(hitter)
+                all_hitters.sort(key=itemgetter("sort_key"))
+                strong_count, bubble_count = tier_counts[Tier.STRONG], tier_counts[Tier.BUBBLE]
+                weak_count = len(all_hitters) - strong_count - bubble_count  # 🔴 or ❓
+
+                # Add top 9 hitters to table (likely lineup)
+                hitting_table = make_hitting_table(opponent_team, all_hitters)
 
                 console.print(hitting_table)
                 
@@ -1432,9 +1682,9 @@ def all_games(date: str = None, use_cache: bool = True):
                 
                 # Summary for ALL hitters with context-aware recommendations
                 if len(all_hitters) > 0:
-                    strong_pct = len(strong_hitters) / len(all_hitters) * 100
-                    bubble_pct = len(bubble_hitters) / len(all_hitters) * 100
-                    weak_pct = len(weak_hitters) / len(all_hitters) * 100
+                    strong_pct = strong_count / len(all_hitters) * 100
+                    bubble_pct = bubble_count / len(all_hitters) * 100
+                    weak_pct = weak_count / len(all_hitters) * 100
                     
                     # Summary stats table for entire roster
                     summary_table = Table(title=f"{opponent_team} Complete Roster Summary", show_header=True, header_style="bold cyan")
@@ -1442,15 +1692,16 @@ def all_games(date: str = None, use_cache: bool = True):
                     summary_table.add_column("Count", style="yellow")
                     summary_table.add_column("Percentage", style="green")
                     
-                    summary_table.add_row("🟢 Strong Hitters", str(len(strong_hitters)), f"{strong_pct:.1f}%")
-                    summary_table.add_row("🟡 Bubble Hitters", str(len(bubble_hitters)), f"{bubble_pct:.1f}%")
-                    summary_table.add_row("🔴 Weak Hitters", str(len(weak_hitters)), f"{weak_pct:.1f}%")
+                    summary_table.add_row("🟢 Strong Hitters", str(strong_count), f"{strong_pct:.1f}%")
+                    summary_table.add_row("🟡 Bubble Hitters", str(bubble_count), f"{bubble_pct:.1f}%")
+                    summary_table.add_row("🔴 Weak Hitters", str(weak_count), f"{weak_pct:.1f}%")
                     summary_table.add_row("Total Roster Hitters", str(len(all_hitters)), "100.0%")
                     
                     # Add likely starting lineup analysis
                     if len(all_hitters) >= 9:
-                        top_9_strong = sum(1 for h in all_hitters[:9] if h["tier"] == "🟢")
-                        top_9_bubble = sum(1 for h in all_hitters[:9] if h["tier"] == "🟡")
+                        top_9_tiers = Counter(h["tier_code"] for h in all_hitters[:9])
+                        top_9_strong = top_9_tiers[Tier.STRONG]
+                        top_9_bubble = top_9_tiers[Tier.BUBBLE]
                         top_9_weak = 9 - top_9_strong - top_9_bubble
                         
                         summary_table.add_row("", "", "")  # Separator
@@ -1464,8 +1715,9 @@ def all_games(date: str = None, use_cache: bool = True):
                     # Bench depth analysis
                     if len(all_hitters) > 9:
                         bench_hitters = all_hitters[9:]
-                        bench_strong = sum(1 for h in bench_hitters if h["tier"] == "🟢")
-                        bench_bubble = sum(1 for h in bench_hitters if h["tier"] == "🟡")
+                        bench_tiers = Counter(h["tier_code"] for h in bench_hitters)
+                        bench_strong = bench_tiers[Tier.STRONG]
+                        bench_bubble = bench_tiers[Tier.BUBBLE]
                         bench_weak = len(bench_hitters) - bench_strong - bench_bubble
                         
                         console.print(f"\n[bold yellow]🛏️ Bench Depth Analysis ({len(bench_hitters)} players)[/bold yellow]")
@@ -1481,7 +1733,7 @@ def all_games(date: str = None, use_cache: bool = True):
                             console.print(f"[yellow]⚠️ LIMITED DEPTH: No strong hitters on the bench[/yellow]")
 
                     # Context-aware recommendations based on pitcher strength
-                    is_weak_pitcher_result = is_weak_pitcher(stats)
+                    is_weak_pitcher_result = pitcher_is_weak(pitcher)
                     if is_weak_pitcher_result:
                         # Against weak pitchers - look for offensive opportunities
                         lineup_strong_pct = (top_9_strong/9*100) if len(all_hitters) >= 9 else strong_pct
@@ -1505,15 +1757,27 @@ def all_games(date: str = None, use_cache: bool = True):
                             console.print(f"[dim]🛡️ PITCHER ADVANTAGE: {lineup_weak_pct:.1f}% weak hitters vs strong pitcher[/dim]")
                         else:
                             console.print(f"[yellow]⚖️ BALANCED MATCHUP: Mixed lineup vs strong pitcher[/yellow]")
+            elif roster:
+                console.print(f"[yellow]No position players in {opponent_team} roster.[/yellow]")
             else:
                 console.print(f"[yellow]No roster data found for {opponent_team}.[/yellow]")
             
             console.print("\n" + "="*60 + "\n")
 
+    weak_games = [game for game in all_games_list if game.get('weak_pitcher_count', 0) > 0]
+    weak_games_table = None
+    if weak_games:
+        weak_games_table = Table(title=f"Weak Pitcher Games - {date}", show_header=True, header_style="bold red")
+        weak_games_table.add_column("Game #", style="bright_blue", width=8)
+        weak_games_table.add_column("Matchup", style="green", width=35)
+        weak_games_table.add_column("Weak Pitcher(s)", style="red", width=30)
+
+        for i, game_info in enumerate(weak_games, 1):
+            weak_pitchers = ", ".join(game_info.get('weak_pitcher_names', []))
+            weak_games_table.add_row(str(i), game_info["matchup"], weak_pitchers)
+
     def display_weak_pitcher_games_only():
         """Display only games with weak pitchers."""
-        weak_games = [game for game in all_games_list if game.get('weak_pitcher_count', 0) > 0]
-        
         if not weak_games:
             console.print(f"[green]🎯 No weak pitchers identified for {date}[/green]")
             console.print(f"[yellow]All pitchers meet strength criteria - no favorable matchups found.[/yellow]")
@@ -1522,21 +1786,7 @@ def all_games(date: str = None, use_cache: bool = True):
         console.print(f"\n[bold red]⚠️ WEAK PITCHER GAMES ONLY - {date} ⚠️[/bold red]")
         console.print(f"[green]Found {len(weak_games)} game(s) with weak pitcher matchups![/green]\n")
         
-        table = Table(title=f"Weak Pitcher Games - {date}", show_header=True, header_style="bold red")
-        table.add_column("Game #", style="bright_blue", width=8)
-        table.add_column("Matchup", style="green", width=35)
-        table.add_column("Weak Pitcher(s)", style="red", width=30)
-
-        for i, game_info in enumerate(weak_games, 1):
-            away_team = game_info.get('away_team', 'Unknown')
-            home_team = game_info.get('home_team', 'Unknown')
-            matchup = f"{away_team} @ {home_team}"
-            
-            weak_pitchers = ", ".join(game_info.get('weak_pitcher_names', []))
-            
-            table.add_row(str(i), matchup, weak_pitchers)
-
-        console.print(table)
+        console.print(weak_games_table)
         console.print("\n[cyan]Press Enter to return to all games menu...[/cyan]")
         console.input()
 
@@ -1555,7 +1805,9 @@ def all_games(date: str = None, use_cache: bool = True):
             try:
                 game_num = int(choice)
                 if 1 <= game_num <= len(all_games_list):
-                    display_game_matchup_analysis(game_num - 1)
+                    # Buffer the game's tables and summaries and write them to the terminal in one go
+                    with console:
+                        display_game_matchup_analysis(game_num - 1)
                     console.print("\n[cyan]Press Enter to return to games menu...[/cyan]")
                     console.input()
                 else:
@@ -1587,7 +1839,6 @@ def serve(host: str = "0.0.0.0", port: int = 8000):
     """Launch Quantum Edge web UI."""
     import uvicorn
     import webbrowser
-    import threading
     import time
     
     console.print(f"[bold cyan]🌐 Starting Quantum Edge Web Server...[/bold cyan]")
@@ -1621,11 +1872,14 @@ def serve(host: str = "0.0.0.0", port: int = 8000):
         console.print(f"[green]👋 Thanks for using Quantum Edge Analytics![/green]")
 
 @app.command()
-def update_streaks():
-    """Update hit streak data for all players with improved logic and cache results."""
-    from app.services.mlb_api import get_last_10_games, classify_hitter, get_hit_streak
+def update_streaks(force: bool = False):
+    """Update hit streak data for all players with improved logic and cache results.
+
+    Streaks already computed today are reused from the daily cache unless --force is given.
+    """
+    from app.services.mlb_api import get_last_10_games_batch, compute_hit_streak, classify_hitter
+    from app.services.loader import fetch_many
     import os
-    import json
     from datetime import datetime, date
 
     console.print("[cyan]🔄 Updating hit streak data for all players...[/cyan]")
@@ -1643,87 +1897,102 @@ def update_streaks():
         console.print("[red]Players data not found. Please run 'pull-player-stats' first.[/red]")
         return
 
-    with open(teams_file, "r") as f:
-        teams = {team["id"]: team["name"] for team in json.load(f)}
+    teams = {team["id"]: team["name"] for team in load_json(teams_file)}
 
-    hitters_on_streak = []
-    detailed_streak_data = []
-    processed_count = 0
-    total_players = len([f for f in os.listdir(players_folder) if f.endswith(".json")])
-
-    for player_file in os.listdir(players_folder):
-        if player_file.endswith(".json"):
-            processed_count += 1
-            if processed_count % 50 == 0:
-                console.print(f"[dim]Processed {processed_count}/{total_players} players...[/dim]")
-                
-            player_path = os.path.join(players_folder, player_file)
-            try:
-                with open(player_path, "r") as f:
-                    player_data = json.load(f)
-            except Exception as e:
-                logger.debug(f"Error reading player file {player_file}: {e}")
-                continue
+    def process_player(player_data):
+        """Return (detailed entry, streak entry or None) for one player record, or None to skip it."""
+        player_id = player_data.get("id")
+        full_name = player_data.get("fullName", "Unknown")
+        
+        if not player_id:
+            return None
+
+        # Skip players who are not hitters
+        position = player_data.get("position", "")
+        if position == "P":
+            return None
+
+        # Get team name with multiple fallback methods
+        current_team = player_data.get("currentTeam")
+        if not isinstance(current_team, dict):
+            current_team = {}
+        team_name = (
+            teams.get(current_team.get("id"))
+            or current_team.get("name")
+            or find_team_name_by_player_name(full_name, teams)
+        )
 
-            player_id = player_data.get("id")
-            full_name = player_data.get("fullName", "Unknown")
+        try:
+            # Use the improved hit streak calculation that looks at last 10 games
+            streak = hit_streak_for_today(player_id) or 0
             
-            if not player_id:
-                continue
-
-            # Skip players who are not hitters
-            position = player_data.get("position", "")
-            if position == "P":
-                continue
-
-            # Get team name with multiple fallback methods
-            team_id = player_data.get("currentTeam", {}).get("id") if isinstance(player_data.get("currentTeam"), dict) else None
-            team_name = teams.get(team_id, "Unknown Team")
-
-            # Fallback team name methods
-            if team_name == "Unknown Team":
-                team_name = player_data.get("currentTeam", {}).get("name", "Unknown Team") if isinstance(player_data.get("currentTeam"), dict) else "Unknown Team"
-
-            if team_name == "Unknown Team":
-                team_name = get_team_name(team_id, teams)
-
-            if team_name == "Unknown Team":
-                team_name = find_team_name_by_player_name(full_name, teams)
-
-            try:
-                # Use the improved hit streak calculation that looks at last 10 games
-                streak = get_hit_streak(player_id, num_games=10)
-                
-                # Get player tier for additional context
-                tier = classify_hitter(player_data)
-                
-                # Create detailed entry for all players (including those with 0 streak)
-                detailed_entry = {
-                    "player_id": player_id,
+            # Get player tier for additional context
+            tier = classify_hitter(player_data)
+            
+            # Create detailed entry for all players (including those with 0 streak)
+            detailed_entry = {
+                "player_id": player_id,
+                "name": full_name,
+                "team": team_name,
+                "position": position,
+                "streak": streak,
+                "tier": tier,
+                "avg": player_data.get("avg", "N/A"),
+                "ops": player_data.get("ops", "N/A"),
+                "last_updated": datetime.now().isoformat()
+            }
+            
+            # Only include players with streaks of 2 or more in the main cache
+            streak_entry = None
+            if streak >= 2:
+                streak_entry = {
                     "name": full_name,
                     "team": team_name,
-                    "position": position,
                     "streak": streak,
                     "tier": tier,
-                    "avg": player_data.get("avg", "N/A"),
-                    "ops": player_data.get("ops", "N/A"),
-                    "last_updated": datetime.now().isoformat()
+                    "avg": player_data.get("avg", "N/A")
                 }
-                detailed_streak_data.append(detailed_entry)
+            return detailed_entry, streak_entry
                 
-                # Only include players with streaks of 2 or more in the main cache
-                if streak >= 2:
-                    hitters_on_streak.append({
-                        "name": full_name,
-                        "team": team_name,
-                        "streak": streak,
-                        "tier": tier,
-                        "avg": player_data.get("avg", "N/A")
-                    })
-                    
-            except Exception as e:
-                logger.debug(f"Error processing player {full_name}: {e}")
+        except Exception as e:
+            logger.debug(f"Error processing player {full_name}: {e}")
+            return None
+
+    hitters_on_streak = []
+    detailed_streak_data = []
+    # One read of the consolidated bundle instead of opening every player file
+    players = load_players_bundle()
+    total_players = len(players)
+
+    # Pull game logs for hitters without a streak today in multi-id batches, not one request each
+    streak_cache = _daily_streak_cache()
+    if force:
+        # Recompute every streak; anything a batch misses falls back to a per-player fetch
+        streak_cache.clear()
+    missing_ids = [
+        player_data["id"] for player_data in players.values()
+        if player_data.get("id") and player_data.get("position", "") != "P" and str(player_data["id"]) not in streak_cache
+    ]
+    batches = [missing_ids[i:i + STREAK_BATCH_SIZE] for i in range(0, len(missing_ids), STREAK_BATCH_SIZE)]
+    for games_by_player in fetch_many(get_last_10_games_batch, [(batch,) for batch in batches]):
+        # A failed batch leaves its players to the per-player fallback in process_player
+        for player_id, games in (games_by_player or {}).items():
+            streak_cache[str(player_id)] = compute_hit_streak(games)
+
+    # Streak lookups overlap across workers; results are gathered back here
+    with ThreadPoolExecutor(max_workers=32) as executor:
+        futures = [executor.submit(process_player, player_data) for player_data in players.values()]
+        for processed_count, future in enumerate(as_completed(futures), 1):
+            if processed_count % 50 == 0:
+                console.print(f"[dim]Processed {processed_count}/{total_players} players...[/dim]")
+
+            result = future.result()
+            if result is None:
                 continue
+            detailed_entry, streak_entry = result
+            detailed_streak_data.append(detailed_entry)
+            if streak_entry:
+                hitters_on_streak.append(streak_entry)
 
     # Sort hitters by streak length (descending), then by batting average (descending)
     hitters_on_streak.sort(key=lambda x: (-x["streak"], -float(x["avg"]) if x["avg"] != "N/A" else 0))
@@ -1732,11 +2001,8 @@ def update_streaks():
     detailed_streak_data.sort(key=lambda x: (-x["streak"], -float(x["avg"]) if x["avg"] != "N/A" else 0))
 
     # Cache the sorted results
-    with open(cache_file, "w") as f:
-        json.dump(hitters_on_streak, f, indent=4)
-    
-    with open(detailed_cache_file, "w") as f:
-        json.dump(detailed_streak_data, f, indent=4)
+    write_json(cache_file, hitters_on_streak)
+    write_json(detailed_cache_file, detailed_streak_data)
 
     console.print(f"[green]✅ Hit streak data updated for {len(detailed_streak_data)} players![/green]")
     console.print(f"[green]📊 Found {len(hitters_on_streak)} players on hit streaks of 2+ games[/green]")
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Disk-backed response cache for the statsapi probe scripts.
+
+The test_*.py probes keep asking the MLB API for the same endpoint/params
+combinations between runs. Responses are stored as JSON under
+.statsapi_cache/ keyed by endpoint + params, and memoised in-process so a
+repeated call within one run never touches the disk either. Probes call
+install_session() to point statsapi at a shared keep-alive requests.Session.
+"""
+
+import hashlib
+import json
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+import requests
+from requests.adapters import HTTPAdapter
+
+sys.path.append('./MLB-StatsAPI')
+import statsapi
+
+_CACHE_DIR = Path(".statsapi_cache")
+
+# statsapi calls requests.get() per request, which opens a new TLS connection
+# every time. install_session() routes it through one pooled keep-alive session
+# instead; the pool size covers the ThreadPoolExecutor fan-outs in the probes.
+# max_retries=3 lets urllib3 retry a request up to three times on connection
+# and read errors (e.g. a dropped keep-alive socket); error status codes are
+# returned as-is, never retried.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=3))
+
+
+class _SessionRequests:
+    """Stands in for the requests module inside statsapi, sending get/post through _SESSION"""
+
+    get = staticmethod(_SESSION.get)
+    post = staticmethod(_SESSION.post)
+
+    def __getattr__(self, name):
+        return getattr(requests, name)
+
+
+def install_session():
+    """Point statsapi's HTTP calls at the shared keep-alive session"""
+    statsapi.requests = _SessionRequests()
+
+
+@lru_cache(maxsize=None)
+def _cached_get(endpoint, params_key):
+    key = hashlib.sha1(json.dumps([endpoint, params_key]).encode()).hexdigest()
+    cache_file = _CACHE_DIR / f"{key}.json"
+    try:
+        return json.loads(cache_file.read_text())
+    except (FileNotFoundError, ValueError):
+        pass
+
+    data = statsapi.get(endpoint, dict(params_key))
+    _CACHE_DIR.mkdir(exist_ok=True)
+    cache_file.write_text(json.dumps(data))
+    return data
+
+
+def cached_get(endpoint, params):
+    """Drop-in replacement for statsapi.get() that reuses earlier responses"""
+    params_key = tuple(sorted((k, str(v)) for k, v in params.items()))
+    return _cached_get(endpoint, params_key)
+
+
+@lru_cache(maxsize=1024)
+def _get_person(player_id):
+    data = cached_get("person", {"personId": player_id})
+    return (data.get("people") or [{}])[0]
+
+
+def get_person(player_id):
+    """Get a player's /person record ({} if the API has none)"""
+    # IDs arrive as both str and int; normalise so they share a cache entry
+    return _get_person(int(player_id))
+
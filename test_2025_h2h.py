@@ -3,95 +3,94 @@
 import sys
 sys.path.append('./MLB-StatsAPI')
 import statsapi
+from statsapi_cache import install_session
+
+SONNY_GRAY_ID = 543243
+MOOKIE_BETTS_ID = 605141
 
 def test_2025_dodgers_cardinals():
     """Test the specific 6/6/2025 Dodgers vs Cardinals game"""
     print("=== Testing 6/6/2025 Dodgers vs Cardinals Game ===")
     
-    # Get 2025 schedule for Cardinals around June 6, 2025
+    # Get 2025 schedule for Cardinals around June 6, 2025 with probable pitchers hydrated
     try:
-        schedule = statsapi.schedule(start_date='2025-06-05', end_date='2025-06-07', team=138)  # Cardinals
-        print(f"Found {len(schedule)} Cardinals games around 6/6/2025:")
+        schedule = statsapi.get("schedule", {
+            "sportId": 1,
+            "startDate": "2025-06-05",
+            "endDate": "2025-06-07",
+            "teamId": 138,  # Cardinals
+            "hydrate": "probablePitcher(note)"
+        })
+        games = [game for day in schedule.get('dates', []) for game in day.get('games', [])]
+        print(f"Found {len(games)} Cardinals games around 6/6/2025:")
         
-        for game in schedule:
-            print(f"Date: {game['game_date']}")
-            print(f"  {game['away_name']} @ {game['home_name']}")
-            print(f"  Away Pitcher: {game.get('away_probable_pitcher', 'TBD')}")
-            print(f"  Home Pitcher: {game.get('home_probable_pitcher', 'TBD')}")
-            print(f"  Game ID: {game['game_id']}")
-            print(f"  Status: {game['status']}")
+        for game in games:
+            away = game.get('teams', {}).get('away', {})
+            home = game.get('teams', {}).get('home', {})
+            print(f"Date: {game.get('officialDate')}")
+            print(f"  {away.get('team', {}).get('name')} @ {home.get('team', {}).get('name')}")
+            print(f"  Away Pitcher: {away.get('probablePitcher', {}).get('fullName', 'TBD')}")
+            print(f"  Home Pitcher: {home.get('probablePitcher', {}).get('fullName', 'TBD')}")
+            print(f"  Game ID: {game.get('gamePk')}")
+            print(f"  Status: {game.get('status', {}).get('detailedState')}")
             print()
             
     except Exception as e:
         print(f"Error getting schedule: {e}")
 
-def test_2025_player_stats():
+def fetch_2025_people_stats():
+    """Fetch season and game log stats for Sonny Gray and Mookie Betts in one request"""
+    people = statsapi.get("people", {
+        "personIds": f"{SONNY_GRAY_ID},{MOOKIE_BETTS_ID}",
+        "hydrate": "stats(group=[pitching,hitting],type=[season,gameLog],season=2025)"
+    })
+    
+    # Index splits by person, stat type and group, e.g. stats[605141][("gameLog", "hitting")]
+    stats = {}
+    for person in people.get('people', []):
+        person_stats = stats.setdefault(person.get('id'), {})
+        for entry in person.get('stats', []):
+            key = (entry.get('type', {}).get('displayName'), entry.get('group', {}).get('displayName'))
+            person_stats[key] = entry.get('splits', [])
+    return stats
+
+def report_2025_player_stats(people_stats):
     """Test getting 2025 stats for Sonny Gray and Dodgers players"""
     print("=== Testing 2025 Player Stats ===")
     
     # Check if Sonny Gray has 2025 stats
-    try:
-        sonny_stats = statsapi.get("stats", {
-            "stats": "season",
-            "group": "pitching", 
-            "season": "2025",
-            "personId": "543243"  # Sonny Gray
-        })
-        
-        if 'stats' in sonny_stats and sonny_stats['stats']:
-            splits = sonny_stats['stats'][0].get('splits', [])
-            print(f"Sonny Gray 2025: Found {len(splits)} splits")
-            if splits:
-                split = splits[0]
-                team = split.get('team', {})
-                print(f"  Team: {team.get('name')} (ID: {team.get('id')})")
-                stat = split.get('stat', {})
-                print(f"  Games: {stat.get('gamesStarted', 0)} GS, ERA: {stat.get('era', 'N/A')}")
-        else:
-            print("No 2025 stats found for Sonny Gray")
-            
-    except Exception as e:
-        print(f"Error getting Sonny Gray 2025 stats: {e}")
+    splits = people_stats.get(SONNY_GRAY_ID, {}).get(("season", "pitching"), [])
+    if splits:
+        print(f"Sonny Gray 2025: Found {len(splits)} splits")
+        split = splits[0]
+        team = split.get('team', {})
+        print(f"  Team: {team.get('name')} (ID: {team.get('id')})")
+        stat = split.get('stat', {})
+        print(f"  Games: {stat.get('gamesStarted', 0)} GS, ERA: {stat.get('era', 'N/A')}")
+    else:
+        print("No 2025 stats found for Sonny Gray")
     
     # Check Mookie Betts 2025 stats
-    try:
-        mookie_stats = statsapi.get("stats", {
-            "stats": "season",
-            "group": "hitting",
-            "season": "2025", 
-            "personId": "605141"  # Mookie Betts
-        })
-        
-        if 'stats' in mookie_stats and mookie_stats['stats']:
-            splits = mookie_stats['stats'][0].get('splits', [])
-            print(f"Mookie Betts 2025: Found {len(splits)} splits")
-            if splits:
-                split = splits[0]
-                team = split.get('team', {})
-                print(f"  Team: {team.get('name')} (ID: {team.get('id')})")
-                stat = split.get('stat', {})
-                print(f"  Games: {stat.get('gamesPlayed', 0)} GP, AVG: {stat.get('avg', 'N/A')}")
-        else:
-            print("No 2025 stats found for Mookie Betts")
-            
-    except Exception as e:
-        print(f"Error getting Mookie Betts 2025 stats: {e}")
+    splits = people_stats.get(MOOKIE_BETTS_ID, {}).get(("season", "hitting"), [])
+    if splits:
+        print(f"Mookie Betts 2025: Found {len(splits)} splits")
+        split = splits[0]
+        team = split.get('team', {})
+        print(f"  Team: {team.get('name')} (ID: {team.get('id')})")
+        stat = split.get('stat', {})
+        print(f"  Games: {stat.get('gamesPlayed', 0)} GP, AVG: {stat.get('avg', 'N/A')}")
+    else:
+        print("No 2025 stats found for Mookie Betts")
 
-def test_game_log_approach():
+def report_game_log_approach(people_stats):
     """Test using game log to find H2H data"""
     print("\n=== Testing Game Log Approach for H2H ===")
     
-    # Get Mookie Betts game log for 2025
+    # Mookie Betts game log for 2025 comes from the same hydrated people request
     try:
-        game_log = statsapi.get("stats", {
-            "stats": "gameLog",
-            "group": "hitting",
-            "season": "2025",
-            "personId": "605141"  # Mookie Betts
-        })
+        splits = people_stats.get(MOOKIE_BETTS_ID, {}).get(("gameLog", "hitting"), [])
         
-        if 'stats' in game_log and game_log['stats']:
-            splits = game_log['stats'][0].get('splits', [])
+        if splits:
             print(f"Mookie Betts 2025 game log: Found {len(splits)} games")
             
             # Look for games around 6/6/2025 or against Cardinals
@@ -139,6 +138,12 @@ def test_game_log_approach():
         print(f"Error getting game log: {e}")
 
 if __name__ == "__main__":
+    install_session()
     test_2025_dodgers_cardinals()
-    test_2025_player_stats()
-    test_game_log_approach()
+    try:
+        people_stats = fetch_2025_people_stats()
+    except Exception as e:
+        print(f"Error getting 2025 player stats: {e}")
+        people_stats = {}
+    report_2025_player_stats(people_stats)
+    report_game_log_approach(people_stats)
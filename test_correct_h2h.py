@@ -1,140 +1,189 @@
 #!/usr/bin/env python3
 
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 sys.path.append('./MLB-StatsAPI')
-import statsapi
+from statsapi_cache import cached_get, get_person, install_session
+
+MOOKIE_BETTS_ID = "605141"
+SONNY_GRAY_ID = "543243"
+SEASON = "2024"
+
+# Stats types probed by test_player_stats
+_STATS_TYPES = (
+    "season",
+    "hitting",
+    "pitching",
+    "fielding",
+    "sabermetrics",
+    "advanced",
+    "vs",
+    "vsP",
+    "vsL",
+    "vsR",
+    "vsPitcher",
+    "vsL_season",
+    "vsR_season",
+)
+
+# Request shapes probed by test_vs_pitcher_methods (Mookie Betts vs Sonny Gray)
+_METHODS = (
+    # Method 1: Use stats endpoint with vs type
+    {
+        "endpoint": "stats",
+        "params": {
+            "stats": "vsP",
+            "group": "hitting",
+            "season": SEASON,
+            "personId": MOOKIE_BETTS_ID,
+            "opponentId": SONNY_GRAY_ID
+        }
+    },
+    # Method 2: Try gameLog to find games they played
+    {
+        "endpoint": "stats",
+        "params": {
+            "stats": "gameLog",
+            "group": "hitting",
+            "season": SEASON,
+            "personId": MOOKIE_BETTS_ID
+        }
+    },
+    # Method 3: Try with different parameter name
+    {
+        "endpoint": "stats",
+        "params": {
+            "stats": "season",
+            "group": "hitting",
+            "season": SEASON,
+            "personId": MOOKIE_BETTS_ID,
+            "pitcherId": SONNY_GRAY_ID
+        }
+    },
+)
 
 def test_player_info():
     """Test basic player info call"""
     print("=== Testing Player Info ===")
     try:
-        player_data = statsapi.get("person", {"personId": "543243"})  # Sonny Gray
-        print(f"Success! Player data keys: {list(player_data.keys())}")
-        if 'people' in player_data:
-            player = player_data['people'][0]
+        player = get_person(SONNY_GRAY_ID)
+        print(f"Success! Player data keys: {list(player.keys())}")
+        if player:
             print(f"Player: {player.get('fullName', 'Unknown')} (ID: {player.get('id')})")
     except Exception as e:
         print(f"Error: {e}")
 
+def _report_splits(splits):
+    """Print what a stats type's splits look like"""
+    print(f"SUCCESS! Found {len(splits)} splits")
+    if splits:
+        split = splits[0]
+        print(f"First split keys: {list(split.keys())}")
+        if 'stat' in split:
+            print(f"Stat keys: {list(split['stat'].keys())}")
+
 def test_player_stats():
     """Test different ways to get player stats"""
     print("\n=== Testing Player Stats Types ===")
     
     # Try to get stats for Mookie Betts
-    player_id = "605141"  # Mookie Betts
-    season = "2024"
+    player_id = MOOKIE_BETTS_ID
+    season = SEASON
     
-    # Test different stats types
-    stats_types = [
-        "season",
-        "hitting", 
-        "pitching",
-        "fielding",
-        "sabermetrics",
-        "advanced",
-        "vs",
-        "vsP",
-        "vsL",
-        "vsR",
-        "vsPitcher",
-        "vsL_season",
-        "vsR_season"
-    ]
+    # The stats endpoint takes a comma-separated list of types, so ask for all
+    # of them in one request. Each returned stats object names its own type.
+    params = {
+        "stats": ",".join(_STATS_TYPES),
+        "group": "hitting",
+        "season": season,
+        "personId": player_id
+    }
+    print(f"Params: {params}")
+    try:
+        data = cached_get("stats", params)
+    except Exception as e:
+        # One unrecognised type fails the whole batch - probe them one by one instead
+        print(f"Combined request failed: {e}")
+        print("Falling back to one request per stats type")
+        return _probe_stats_types_individually(player_id, season)
+    
+    returned = set()
+    for stats_obj in data.get('stats', []):
+        stats_type = stats_obj.get('type', {}).get('displayName', '?')
+        returned.add(stats_type)
+        print(f"\nStats type: {stats_type}")
+        _report_splits(stats_obj.get('splits', []))
     
-    for stats_type in stats_types:
-        try:
-            print(f"\nTrying stats type: {stats_type}")
-            params = {
-                "stats": stats_type,
-                "group": "hitting",
-                "season": season,
-                "personId": player_id
-            }
-            print(f"Params: {params}")
-            data = statsapi.get("stats", params)
-            
-            if 'stats' in data and data['stats']:
-                splits = data['stats'][0].get('splits', [])
-                print(f"SUCCESS! Found {len(splits)} splits")
-                if splits:
-                    split = splits[0]
-                    print(f"First split keys: {list(split.keys())}")
-                    if 'stat' in split:
-                        print(f"Stat keys: {list(split['stat'].keys())}")
-            else:
-                print("No stats found")
+    # Types like vsPitcher need an opponentId and come back empty here -
+    # test_vs_pitcher_methods covers those with their own requests
+    missing = [stats_type for stats_type in _STATS_TYPES if stats_type not in returned]
+    if missing:
+        print(f"\nNo stats returned for: {', '.join(missing)}")
+
+def _probe_stats_types_individually(player_id, season):
+    """Request each stats type on its own, concurrently"""
+    def fetch(stats_type):
+        params = {
+            "stats": stats_type,
+            "group": "hitting",
+            "season": season,
+            "personId": player_id
+        }
+        return params, cached_get("stats", params)
+    
+    # Every probe is an independent round trip, so issue them all at once
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = {executor.submit(fetch, stats_type): stats_type for stats_type in _STATS_TYPES}
+        for future in as_completed(futures):
+            stats_type = futures[future]
+            try:
+                print(f"\nTrying stats type: {stats_type}")
+                params, data = future.result()
+                print(f"Params: {params}")
                 
-        except Exception as e:
-            print(f"Failed: {e}")
+                if 'stats' in data and data['stats']:
+                    _report_splits(data['stats'][0].get('splits', []))
+                else:
+                    print("No stats found")
+                    
+            except Exception as e:
+                print(f"Failed: {e}")
 
 def test_vs_pitcher_methods():
     """Test methods to get vs pitcher stats"""
     print("\n=== Testing Vs Pitcher Methods ===")
     
-    # Try different approaches for H2H data
-    batter_id = "605141"  # Mookie Betts
-    pitcher_id = "543243"  # Sonny Gray
-    season = "2024"
-    
-    methods = [
-        # Method 1: Use stats endpoint with vs type
-        {
-            "endpoint": "stats",
-            "params": {
-                "stats": "vsP",
-                "group": "hitting", 
-                "season": season,
-                "personId": batter_id,
-                "opponentId": pitcher_id
-            }
-        },
-        # Method 2: Try gameLog to find games they played
-        {
-            "endpoint": "stats", 
-            "params": {
-                "stats": "gameLog",
-                "group": "hitting",
-                "season": season,
-                "personId": batter_id
-            }
-        },
-        # Method 3: Try with different parameter name
-        {
-            "endpoint": "stats",
-            "params": {
-                "stats": "season",
-                "group": "hitting",
-                "season": season,
-                "personId": batter_id,
-                "pitcherId": pitcher_id  
-            }
+    with ThreadPoolExecutor(max_workers=len(_METHODS)) as executor:
+        futures = {
+            executor.submit(cached_get, method["endpoint"], method["params"]): (i, method)
+            for i, method in enumerate(_METHODS, 1)
         }
-    ]
-    
-    for i, method in enumerate(methods, 1):
-        print(f"\n--- Method {i}: {method['endpoint']} ---")
-        print(f"Params: {method['params']}")
-        try:
-            data = statsapi.get(method["endpoint"], method["params"])
-            print(f"SUCCESS! Keys: {list(data.keys())}")
-            
-            if 'stats' in data and data['stats']:
-                stats_obj = data['stats'][0]
-                splits = stats_obj.get('splits', [])
-                print(f"Found {len(splits)} splits")
+        for future in as_completed(futures):
+            i, method = futures[future]
+            print(f"\n--- Method {i}: {method['endpoint']} ---")
+            print(f"Params: {method['params']}")
+            try:
+                data = future.result()
+                print(f"SUCCESS! Keys: {list(data.keys())}")
                 
-                # Look for relevant splits
-                for j, split in enumerate(splits[:5]):  # Check first 5
-                    print(f"  Split {j+1}: {list(split.keys())}")
-                    if 'opponent' in split:
-                        print(f"    Opponent: {split['opponent']}")
-                    if 'game' in split:
-                        print(f"    Game info available")
-                        
-        except Exception as e:
-            print(f"Failed: {e}")
+                if 'stats' in data and data['stats']:
+                    stats_obj = data['stats'][0]
+                    splits = stats_obj.get('splits', [])
+                    print(f"Found {len(splits)} splits")
+                    
+                    # Look for relevant splits
+                    for j, split in enumerate(splits[:5]):  # Check first 5
+                        print(f"  Split {j+1}: {list(split.keys())}")
+                        if 'opponent' in split:
+                            print(f"    Opponent: {split['opponent']}")
+                        if 'game' in split:
+                            print(f"    Game info available")
+                            
+            except Exception as e:
+                print(f"Failed: {e}")
 
 if __name__ == "__main__":
+    install_session()
     test_player_info()
     test_player_stats()  
     test_vs_pitcher_methods()
@@ -1,8 +1,11 @@
 #!/usr/bin/env python3
 
 import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 sys.path.append('./MLB-StatsAPI')
 import statsapi
+from statsapi_cache import cached_get, get_person, install_session
 
 def explore_game_log():
     """Explore the gameLog data structure to understand H2H possibilities"""
@@ -22,7 +25,7 @@ def explore_game_log():
         }
         
         print(f"Getting game log for player {batter_id} in {season}")
-        data = statsapi.get("stats", params)
+        data = cached_get("stats", params)
         
         if 'stats' in data and data['stats']:
             stats_obj = data['stats'][0]
@@ -58,26 +61,37 @@ def explore_game_log():
             print(f"\n=== Searching for games where they might have faced each other ===")
             
             # First, let's get Sonny Gray's team info
-            gray_data = statsapi.get("person", {"personId": pitcher_id})
+            gray_player = get_person(pitcher_id)
             gray_team = None
-            if 'people' in gray_data and gray_data['people']:
-                gray_player = gray_data['people'][0]
+            if gray_player:
                 print(f"Sonny Gray: {gray_player.get('fullName')}")
                 if 'currentTeam' in gray_player:
                     gray_team = gray_player['currentTeam']
                     print(f"  Current Team: {gray_team.get('name')} (ID: {gray_team.get('id')})")
             
             # Look for games against Gray's team
-            potential_games = []
+            splits_by_opponent = defaultdict(list)
             for split in splits:
-                if 'opponent' in split:
-                    opponent = split['opponent']
-                    if gray_team and opponent.get('id') == gray_team.get('id'):
-                        potential_games.append(split)
+                splits_by_opponent[split.get('opponent', {}).get('id')].append(split)
+            potential_games = splits_by_opponent.get(gray_team.get('id'), []) if gray_team else []
             
             print(f"\nFound {len(potential_games)} games against {gray_team.get('name', 'Gray team') if gray_team else 'unknown team'}")
             
-            for i, game in enumerate(potential_games):
+            # Game detail lookups are independent, so fetch them all concurrently
+            game_pks = [game.get('game', {}).get('gamePk') for game in potential_games]
+            
+            def fetch_game_detail(game_pk):
+                if not game_pk:
+                    return None
+                try:
+                    return cached_get("game", {"gamePk": game_pk})
+                except Exception as e:
+                    return e
+            
+            with ThreadPoolExecutor(max_workers=max(1, min(16, len(game_pks)))) as executor:
+                details = list(executor.map(fetch_game_detail, game_pks))
+            
+            for i, (game, game_pk, game_detail) in enumerate(zip(potential_games, game_pks, details)):
                 print(f"\nPotential H2H Game {i+1}:")
                 if 'game' in game:
                     game_info = game['game']
@@ -87,17 +101,14 @@ def explore_game_log():
                     stat = game['stat']
                     print(f"  Stats: {stat.get('atBats', 0)}-{stat.get('hits', 0)}")
                     
-                # Now get detailed game info to see if Gray pitched
-                if 'game' in game:
-                    game_pk = game['game'].get('gamePk')
-                    if game_pk:
-                        print(f"  Checking if Sonny Gray pitched in game {game_pk}...")
-                        try:
-                            game_detail = statsapi.get("game", {"gamePk": game_pk})
-                            # This would be complex to parse, but we could check the pitchers
-                            print(f"    Got game detail data")
-                        except Exception as e:
-                            print(f"    Error getting game detail: {e}")
+                # Now check the detailed game info to see if Gray pitched
+                if game_pk:
+                    print(f"  Checking if Sonny Gray pitched in game {game_pk}...")
+                    if isinstance(game_detail, Exception):
+                        print(f"    Error getting game detail: {game_detail}")
+                    else:
+                        # This would be complex to parse, but we could check the pitchers
+                        print(f"    Got game detail data")
                         
     except Exception as e:
         print(f"Error: {e}")
@@ -127,5 +138,6 @@ def test_simpler_h2h():
         print(f"Error with schedule approach: {e}")
 
 if __name__ == "__main__":
+    install_session()
     explore_game_log()
     test_simpler_h2h()
@@ -2,8 +2,10 @@
 """
 Test script to debug H2H function and understand the MLB API response
 """
+import os
 import statsapi
 import json
+from statsapi_cache import get_person, install_session
 
 def test_h2h_debug(batter_id: int, pitcher_id: int, season: str = "2025"):
     """
@@ -25,8 +27,12 @@ def test_h2h_debug(batter_id: int, pitcher_id: int, season: str = "2025"):
         
         data = statsapi.get("stats", params)
         
-        print(f"\nRaw API Response:")
-        print(json.dumps(data, indent=2))
+        # The full dump re-serializes the whole response, so only do it on request
+        if os.environ.get("H2H_DEBUG_DUMP"):
+            print(f"\nRaw API Response:")
+            print(json.dumps(data, indent=2))
+        else:
+            print(f"\nTop-level keys: {list(data.keys())}")
         
         # Parse the response
         stats_list = data.get("stats", [])
@@ -59,13 +65,14 @@ def test_h2h_debug(batter_id: int, pitcher_id: int, season: str = "2025"):
             
     except Exception as e:
         print(f"Error occurred: {type(e).__name__}: {e}")
-        import traceback
-        traceback.print_exc()
+        if os.environ.get("H2H_DEBUG_DUMP"):
+            import traceback
+            traceback.print_exc()
 
 def get_player_info(player_id: int):
     """Get basic player info to verify the ID is correct"""
     try:
-        player = statsapi.get("player", {"playerId": player_id})
+        player = get_person(player_id)
         print(f"Player {player_id}: {player.get('fullName', 'Unknown')} ({player.get('currentTeam', {}).get('name', 'No Team')})")
         return player
     except Exception as e:
@@ -73,6 +80,7 @@ def get_player_info(player_id: int):
         return None
 
 if __name__ == "__main__":
+    install_session()
     # Let's test with some known player IDs
     # Sonny Gray's MLB ID (need to find this)
     # Let's first try with some known players
@@ -1,104 +1,146 @@
 #!/usr/bin/env python3
 
 import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 sys.path.append('./MLB-StatsAPI')
 import statsapi
+from statsapi_cache import cached_get, install_session
+
+# Cardinals team ID - Sonny Gray's team in that game
+CARDINALS_TEAM_ID = 138
+
+# Real matchups from the 6/6/2025 game, with the pitcher's team as of that game
+# (not his current team, which a later trade would change)
+_MATCHUPS = (
+    {"batter": "660271", "batter_name": "Shohei Ohtani", "pitcher": "543243", "pitcher_name": "Sonny Gray", "pitcher_team_id": CARDINALS_TEAM_ID},
+    {"batter": "605141", "batter_name": "Mookie Betts", "pitcher": "543243", "pitcher_name": "Sonny Gray", "pitcher_team_id": CARDINALS_TEAM_ID},
+    {"batter": "518692", "batter_name": "Freddie Freeman", "pitcher": "543243", "pitcher_name": "Sonny Gray", "pitcher_team_id": CARDINALS_TEAM_ID},
+    {"batter": "606192", "batter_name": "Teoscar Hernández", "pitcher": "543243", "pitcher_name": "Sonny Gray", "pitcher_team_id": CARDINALS_TEAM_ID},
+)
+
+# H2H approaches tried for each matchup, in order
+_METHODS = (
+    {
+        "name": "Game Log Analysis",
+        "method": "gameLog"
+    },
+    {
+        "name": "Splits Analysis",
+        "method": "splits"
+    },
+    {
+        "name": "Season with Pitcher Filter",
+        "method": "season_filter"
+    },
+)
 
 def test_specific_h2h_matchups():
     """Test H2H with actual players from 6/6/2025 Dodgers @ Cardinals game"""
     print("=== Testing Real H2H Matchups from 6/6/2025 Game ===")
     
-    # Real matchups from the game
-    matchups = [
-        {"batter": "660271", "batter_name": "Shohei Ohtani", "pitcher": "543243", "pitcher_name": "Sonny Gray"},
-        {"batter": "605141", "batter_name": "Mookie Betts", "pitcher": "543243", "pitcher_name": "Sonny Gray"},
-        {"batter": "518692", "batter_name": "Freddie Freeman", "pitcher": "543243", "pitcher_name": "Sonny Gray"},
-        {"batter": "606192", "batter_name": "Teoscar Hernández", "pitcher": "543243", "pitcher_name": "Sonny Gray"},
-    ]
-    
-    for matchup in matchups:
-        print(f"\n=== {matchup['batter_name']} vs {matchup['pitcher_name']} ===")
+    def run_matchup(matchup):
+        # Buffer this matchup's output so concurrent workers don't interleave;
+        # the lines are printed in _MATCHUPS order below
+        lines = []
+        log = lines.append
+        log(f"\n=== {matchup['batter_name']} vs {matchup['pitcher_name']} ===")
         
-        # Test different H2H approaches
-        methods = [
-            {
-                "name": "Game Log Analysis",
-                "method": "gameLog"
-            },
-            {
-                "name": "Splits Analysis", 
-                "method": "splits"
-            },
-            {
-                "name": "Season with Pitcher Filter",
-                "method": "season_filter"
-            }
-        ]
+        batter_id = matchup['batter']
+        pitcher_id = matchup['pitcher']
+        
+        # Fetch the batter's game log once and index it by opponent team
+        splits_by_opponent = get_splits_by_opponent(batter_id, log=log)
         
-        for method in methods:
-            result = test_h2h_method(matchup['batter'], matchup['pitcher'], method)
+        for method in _METHODS:
+            result = test_h2h_method(batter_id, pitcher_id, method,
+                                     splits_by_opponent, matchup['pitcher_team_id'],
+                                     log=log)
             if result != "0-0":
-                print(f"SUCCESS with {method['name']}: {result}")
+                log(f"SUCCESS with {method['name']} for {matchup['batter_name']}: {result}")
+                return result, lines
+        return None, lines
+    
+    # Matchups are independent, so run them concurrently, but take results in
+    # _MATCHUPS order so the first matchup with a result wins, as before. Once
+    # we have one, queued matchups are cancelled and running ones are waited on.
+    with ThreadPoolExecutor(max_workers=len(_MATCHUPS)) as executor:
+        futures = [executor.submit(run_matchup, matchup) for matchup in _MATCHUPS]
+        for future in futures:
+            try:
+                result, lines = future.result()
+            except Exception as e:
+                print(f"  Matchup failed: {e}")
+                continue
+            for line in lines:
+                print(line)
+            if result:
+                for pending in futures:
+                    pending.cancel()
                 return result
     
     return "0-0"
 
-def test_h2h_method(batter_id, pitcher_id, method_info):
+def get_splits_by_opponent(batter_id, log=print):
+    """Get a batter's 2025 game log splits grouped by opponent team ID"""
+    splits_by_opponent = defaultdict(list)
+    try:
+        data = cached_get("stats", {
+            "stats": "gameLog",
+            "group": "hitting",
+            "season": "2025",
+            "personId": batter_id
+        })
+        
+        if 'stats' in data and data['stats']:
+            for split in data['stats'][0].get('splits', []):
+                splits_by_opponent[split.get('opponent', {}).get('id')].append(split)
+    except Exception as e:
+        log(f"  Game log fetch failed: {e}")
+    
+    return splits_by_opponent
+
+def test_h2h_method(batter_id, pitcher_id, method_info, batter_gamelog, pitcher_team_id, verbose=False, log=print):
     """Test a specific H2H method"""
     method_name = method_info['name']
     method_type = method_info['method']
     
-    print(f"\nTrying {method_name}...")
+    log(f"\nTrying {method_name}...")
     
     try:
         if method_type == "gameLog":
-            # Get batter's game log and look for games against pitcher's team
-            data = statsapi.get("stats", {
-                "stats": "gameLog",
-                "group": "hitting",
-                "season": "2025",
-                "personId": batter_id
-            })
+            # Look for games against the pitcher's team (Cardinals for Sonny Gray in that game)
+            cardinals_games = batter_gamelog.get(pitcher_team_id, [])
             
-            if 'stats' in data and data['stats']:
-                splits = data['stats'][0].get('splits', [])
-                
-                # Look for games against Cardinals (Sonny Gray's team in that game)
-                cardinals_games = []
-                for split in splits:
-                    opponent = split.get('opponent', {})
-                    if opponent.get('id') == 138:  # Cardinals team ID
-                        cardinals_games.append(split)
-                
-                print(f"  Found {len(cardinals_games)} games vs Cardinals")
-                
-                # Sum up stats from Cardinals games (approximates H2H vs Cardinals pitchers)
-                total_ab = 0
-                total_hits = 0
-                
-                for game in cardinals_games:
-                    stat = game.get('stat', {})
-                    ab = stat.get('atBats', 0)
-                    hits = stat.get('hits', 0)
-                    total_ab += ab
-                    total_hits += hits
-                    
-                    print(f"    {game.get('date')}: {hits}-{ab}")
-                
-                if total_ab > 0:
-                    return f"{total_hits}-{total_ab}"
+            log(f"  Found {len(cardinals_games)} games vs team {pitcher_team_id}")
+            
+            # Sum up stats from those games (approximates H2H vs that team's pitchers)
+            # One pass, reading each game's stat dict once
+            total_ab = 0
+            total_hits = 0
+            for game in cardinals_games:
+                stat_get = game.get('stat', {}).get
+                ab = stat_get('atBats', 0)
+                hits = stat_get('hits', 0)
+                total_ab += ab
+                total_hits += hits
+                if verbose:
+                    log(f"    {game.get('date')}: {hits}-{ab}")
+            
+            if total_ab > 0:
+                return f"{total_hits}-{total_ab}"
                     
         elif method_type == "splits":
             # Try to get splits data
-            data = statsapi.get("stats", {
+            data = cached_get("stats", {
                 "stats": "season",
                 "group": "hitting",
                 "season": "2025",
                 "personId": batter_id,
-                "splitId": "vs_team_138"  # Try Cardinals team split
+                "splitId": f"vs_team_{pitcher_team_id}"  # Try pitcher's team split
             })
             
-            print(f"  Splits result: {list(data.keys()) if data else 'No data'}")
+            log(f"  Splits result: {list(data.keys()) if data else 'No data'}")
             
         elif method_type == "season_filter":
             # Try season stats with various filters
@@ -106,37 +148,48 @@ def test_h2h_method(batter_id, pitcher_id, method_info):
                 {"opponentId": pitcher_id},
                 {"pitcherId": pitcher_id},
                 {"opponent": pitcher_id},
-                {"teamId": "138"}  # Cardinals team
+                {"teamId": str(pitcher_team_id)}  # Pitcher's team
             ]
             
-            for filter_params in filters:
-                try:
-                    params = {
-                        "stats": "season",
-                        "group": "hitting",
-                        "season": "2025",
-                        "personId": batter_id
-                    }
-                    params.update(filter_params)
-                    
-                    print(f"    Trying filter: {filter_params}")
-                    data = statsapi.get("stats", params)
+            base_params = {
+                "stats": "season",
+                "group": "hitting",
+                "season": "2025",
+                "personId": batter_id
+            }
+            
+            # Submit every filter at once, but check the responses in filter
+            # order so the highest-priority filter with at-bats still wins
+            with ThreadPoolExecutor(max_workers=len(filters)) as executor:
+                futures = [
+                    executor.submit(cached_get, "stats", {**base_params, **filter_params})
+                    for filter_params in filters
+                ]
+                
+                for filter_params, future in zip(filters, futures):
+                    log(f"    Trying filter: {filter_params}")
+                    try:
+                        data = future.result()
+                    except Exception as e:
+                        log(f"    Filter failed: {e}")
+                        continue
                     
                     if 'stats' in data and data['stats']:
                         splits = data['stats'][0].get('splits', [])
                         if splits:
-                            print(f"    Found {len(splits)} splits!")
+                            log(f"    Found {len(splits)} splits!")
                             for split in splits:
                                 stat = split.get('stat', {})
                                 ab = stat.get('atBats', 0)
                                 hits = stat.get('hits', 0)
                                 if ab > 0:
+                                    # Drop any lower-priority requests that haven't started
+                                    for pending in futures:
+                                        pending.cancel()
                                     return f"{hits}-{ab}"
-                except Exception as e:
-                    print(f"    Filter failed: {e}")
     
     except Exception as e:
-        print(f"  Method failed: {e}")
+        log(f"  Method failed: {e}")
     
     return "0-0"
 
@@ -164,6 +217,7 @@ def test_alternative_approach():
         print(f"Boxscore approach failed: {e}")
 
 if __name__ == "__main__":
+    install_session()
     result = test_specific_h2h_matchups()
     print(f"\nFinal H2H Result: {result}")
     
@@ -1,8 +1,16 @@
 #!/usr/bin/env python3
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
 sys.path.append('./MLB-StatsAPI')
-import statsapi
+from statsapi_cache import cached_get, install_session
+
+# Different approaches to get H2H data: (name, stats type, pitcher param name)
+_H2H_APPROACHES = (
+    ("Method 1: vsPitcher stats", "vsPitcher", "opponentId"),
+    ("Method 2: season stats with pitcher filter", "season", "pitcherId"),
+    ("Method 3: splits with opponent", "splits", "opponent"),
+)
 
 def analyze_specific_game():
     """Analyze the 6/6/2025 Dodgers @ Cardinals game in detail"""
@@ -11,28 +19,29 @@ def analyze_specific_game():
     game_id = "777620"
     
     try:
-        game_data = statsapi.get('game', {'gamePk': game_id})
+        # Only the boxscore teams are needed, so skip the full live feed
+        # (play-by-play and all) and fetch just the boxscore
+        boxscore = cached_get('game_boxscore', {'gamePk': game_id})
         
         # Get team lineups
-        live_data = game_data.get('liveData', {})
-        boxscore = live_data.get('boxscore', {})
         teams = boxscore.get('teams', {})
         
         print("AWAY TEAM (Dodgers) LINEUP:")
         away_batters = teams.get('away', {}).get('batters', [])
-        away_players = teams.get('away', {}).get('players', {})
+        # Boxscore players are keyed "ID<id>"; re-key them by the integer ID once
+        away_players = {int(k[2:]): v for k, v in teams.get('away', {}).get('players', {}).items() if k.startswith('ID')}
         
         for batter_id in away_batters:
-            player = away_players.get(f'ID{batter_id}', {})
+            player = away_players.get(batter_id, {})
             person = player.get('person', {})
             print(f"  {person.get('fullName', 'Unknown')} (ID: {batter_id})")
             
         print("\nHOME TEAM (Cardinals) PITCHERS:")
         home_pitchers = teams.get('home', {}).get('pitchers', [])
-        home_players = teams.get('home', {}).get('players', {})
+        home_players = {int(k[2:]): v for k, v in teams.get('home', {}).get('players', {}).items() if k.startswith('ID')}
         
         for pitcher_id in home_pitchers:
-            player = home_players.get(f'ID{pitcher_id}', {})
+            player = home_players.get(pitcher_id, {})
             person = player.get('person', {})
             print(f"  {person.get('fullName', 'Unknown')} (ID: {pitcher_id})")
             
@@ -41,43 +50,51 @@ def analyze_specific_game():
         
         # Check if any Dodgers batters faced Sonny Gray
         sonny_gray_id = "543243"
-        if sonny_gray_id in [str(p) for p in home_pitchers]:
+        if int(sonny_gray_id) in home_pitchers:
             print(f"✓ Sonny Gray (ID: {sonny_gray_id}) did pitch in this game!")
             
-            # Now find a specific batter to test H2H with
-            for batter_id in away_batters[:5]:  # Check first 5 batters
-                player = away_players.get(f'ID{batter_id}', {})
+            # Now find a specific batter to test H2H with - pull the first 5
+            # batters' game logs in one hydrated /people request, then check
+            # them in lineup order
+            candidate_batters = away_batters[:5]
+            game_pk = int(game_id)  # game log gamePks are ints
+            
+            splits_by_batter = {}
+            try:
+                people_data = cached_get("people", {
+                    "personIds": ",".join(str(batter_id) for batter_id in candidate_batters),
+                    "hydrate": "stats(group=[hitting],type=[gameLog],season=2025)"
+                })
+                for person in people_data.get('people', []):
+                    stats = person.get('stats') or [{}]
+                    splits_by_batter[person.get('id')] = stats[0].get('splits', [])
+            except Exception as e:
+                print(f"  Error getting game logs: {e}")
+            
+            for batter_id in candidate_batters:
+                player = away_players.get(batter_id, {})
                 person = player.get('person', {})
                 batter_name = person.get('fullName', 'Unknown')
                 
                 print(f"\nTesting H2H: {batter_name} (ID: {batter_id}) vs Sonny Gray")
                 
-                # Try to get H2H stats for this specific matchup
-                try:
-                    h2h_data = statsapi.get("stats", {
-                        "stats": "gameLog",
-                        "group": "hitting",
-                        "season": "2025",
-                        "personId": str(batter_id)
-                    })
+                # Look for this specific game, stopping at the first match
+                split = next(
+                    (s for s in splits_by_batter.get(batter_id, [])
+                     if s.get('game', {}).get('gamePk') == game_pk),
+                    None
+                )
+                if split is not None:
+                    print(f"  FOUND GAME LOG ENTRY!")
+                    stat = split.get('stat', {})
+                    ab = stat.get('atBats', 0)
+                    hits = stat.get('hits', 0)
+                    opponent_name = split.get('opponent', {}).get('name')
+                    print(f"  Stats: {ab} AB, {hits} H")
+                    print(f"  Game: {split.get('date')} vs {opponent_name}")
                     
-                    if 'stats' in h2h_data and h2h_data['stats']:
-                        splits = h2h_data['stats'][0].get('splits', [])
-                        
-                        # Look for this specific game
-                        for split in splits:
-                            game_info = split.get('game', {})
-                            if str(game_info.get('gamePk', '')) == game_id:
-                                print(f"  FOUND GAME LOG ENTRY!")
-                                stat = split.get('stat', {})
-                                print(f"  Stats: {stat.get('atBats', 0)} AB, {stat.get('hits', 0)} H")
-                                print(f"  Game: {split.get('date')} vs {split.get('opponent', {}).get('name')}")
-                                
-                                # This proves the game happened - now try H2H approach
-                                return batter_id, sonny_gray_id
-                                
-                except Exception as e:
-                    print(f"  Error getting game log: {e}")
+                    # This proves the game happened - now try H2H approach
+                    return batter_id, sonny_gray_id
         else:
             print(f"✗ Sonny Gray not found in pitchers list")
             
@@ -90,46 +107,27 @@ def test_h2h_with_real_matchup(batter_id, pitcher_id):
     """Test H2H calculation with a real matchup from the game"""
     print(f"\n=== Testing H2H Calculation: Batter {batter_id} vs Pitcher {pitcher_id} ===")
     
-    # Different approaches to get H2H data
-    approaches = [
-        {
-            "name": "Method 1: vsPitcher stats",
-            "params": {
-                "stats": "vsPitcher", 
-                "group": "hitting",
-                "season": "2025",
-                "personId": batter_id,
-                "opponentId": pitcher_id
-            }
-        },
-        {
-            "name": "Method 2: season stats with pitcher filter",
-            "params": {
-                "stats": "season",
-                "group": "hitting", 
-                "season": "2025",
-                "personId": batter_id,
-                "pitcherId": pitcher_id
-            }
-        },
+    # Fire all approaches at once; results are still reported in order so the
+    # first approach with real at-bats wins, as before
+    params_list = [
         {
-            "name": "Method 3: splits with opponent",
-            "params": {
-                "stats": "splits",
-                "group": "hitting",
-                "season": "2025", 
-                "personId": batter_id,
-                "opponent": pitcher_id
-            }
+            "stats": stats_type,
+            "group": "hitting",
+            "season": "2025",
+            "personId": batter_id,
+            pitcher_param: pitcher_id
         }
+        for _, stats_type, pitcher_param in _H2H_APPROACHES
     ]
+    with ThreadPoolExecutor(max_workers=len(params_list)) as executor:
+        futures = [executor.submit(cached_get, "stats", params) for params in params_list]
     
-    for approach in approaches:
-        print(f"\n{approach['name']}:")
-        print(f"Params: {approach['params']}")
+    for (name, _, _), params, future in zip(_H2H_APPROACHES, params_list, futures):
+        print(f"\n{name}:")
+        print(f"Params: {params}")
         
         try:
-            data = statsapi.get("stats", approach['params'])
+            data = future.result()
             print(f"SUCCESS! Keys: {list(data.keys())}")
             
             if 'stats' in data and data['stats']:
@@ -153,6 +151,7 @@ def test_h2h_with_real_matchup(batter_id, pitcher_id):
     return "0-0"
 
 if __name__ == "__main__":
+    install_session()
     batter_id, pitcher_id = analyze_specific_game()
     
     if batter_id and pitcher_id: